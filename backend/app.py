@@ -1,19 +1,61 @@
-from flask import Flask, request, jsonify, make_response
-from flask_cors import CORS
 import os
+
+# Under gunicorn's gevent worker, patch blocking I/O before Flask, requests or
+# slack_sdk import socket/threading so OpenClaw and Slack calls yield to
+# other in-flight requests instead of pinning the worker.
+if os.getenv("GEVENT"):
+    from gevent import monkey
+    monkey.patch_all()
+
+from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from flask_cors import CORS
+from flask_compress import Compress
+import orjson
+import hashlib
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import takewhile
+from operator import itemgetter
 from dotenv import load_dotenv
-import requests
-from openclaw_client import ask_openclaw
+from database import SessionLocal
+from openclaw_client import ask_openclaw, generate_session_id
 from workflow_routes import workflow_bp
 
 # Load environment variables from .env file inside backend folder
 env_path = os.path.join(os.path.dirname(__file__), '.env')
 load_dotenv(dotenv_path=env_path)
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for jsonify() and request.get_json()."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        # orjson reads the raw request bytes directly, no decode to str first
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response instead of the
+        # default dumps() -> str -> encode round trip.
+        obj = self._prepare_response_obj(args, kwargs)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option), mimetype=self.mimetype
+        )
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # PowerPoint output directory
 PPT_OUTPUT_DIR = os.getenv("PPT_OUTPUT_DIR", "/Users/anubhawmathur/development/ppt-output")
@@ -21,58 +63,18 @@ PPT_OUTPUT_DIR = os.getenv("PPT_OUTPUT_DIR", "/Users/anubhawmathur/development/p
 # Ensure output directory exists
 os.makedirs(PPT_OUTPUT_DIR, exist_ok=True)
 
-# Configure CORS
-CORS(app, 
-    origins=["http://localhost:5173", "http://localhost:5174"],
-    allow_headers=["Content-Type"],
-    methods=["GET", "POST", "DELETE", "OPTIONS"])
+# Long-poll limits for /check-ppt-status?wait=...
+PPT_STATUS_MAX_WAIT_SECONDS = 25
+PPT_STATUS_POLL_INTERVAL_SECONDS = 0.5
 
-# Register the workflow API blueprint
-app.register_blueprint(workflow_bp)
-
-# Add CORS headers to all responses
-@app.after_request
-def add_cors_headers(response):
-    origin = request.headers.get('Origin')
-    if origin in ["http://localhost:5173", "http://localhost:5174"]:
-        response.headers['Access-Control-Allow-Origin'] = origin
-    response.headers['Access-Control-Allow-Methods'] = 'GET, POST, DELETE, OPTIONS'
-    response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
-    return response
-
-@app.route('/')
-def health_check():
-    return "OK", 200
-
-# Handle preflight OPTIONS requests explicitly
-@app.route('/generate', methods=['OPTIONS'])
-@app.route('/research', methods=['OPTIONS'])
-@app.route('/generate-ppt', methods=['OPTIONS'])
-def handle_options():
-    response = make_response()
-    origin = request.headers.get('Origin')
-    if origin in ["http://localhost:5173", "http://localhost:5174"]:
-        response.headers['Access-Control-Allow-Origin'] = origin
-    response.headers['Access-Control-Allow-Methods'] = 'POST, OPTIONS'
-    response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
-    return response
-
-# Main route to generate a research proposal as a Google Doc
-@app.route('/generate', methods=['POST'])
-def generate():
-    try:
-        data = request.json
-        if not data or not data.get('prompt'):
-            return jsonify({'error': 'Research topic is required'}), 400
+# Last .pptx listing of PPT_OUTPUT_DIR, shared by /check-ppt-status callers
+PPT_INDEX_MAX_AGE_SECONDS = 2
+_ppt_index = {"dir_mtime_ns": None, "scanned_at": 0.0, "files": []}
+_ppt_index_lock = threading.Lock()
 
-        topic = data['prompt'].strip()
-        
-        # Craft a prompt that instructs OpenClaw to:
-        # 1. Research the topic
-        # 2. Create a structured project proposal
-        # 3. Save it as a Google Doc using the gog skill
-        # Simple prompt: research and return proposal as text
-        prompt = f"""Research this topic using web_search: "{topic}"
+# Proposal instructions sent to OpenClaw by /generate. Kept static and ahead of
+# the user topic so the model provider can reuse its cached prompt prefix.
+PROPOSAL_PROMPT_PREFIX = """Research the topic given at the end of this message using web_search.
 
 Based on your research findings, write a comprehensive project proposal with these sections:
 
@@ -86,84 +88,327 @@ Based on your research findings, write a comprehensive project proposal with the
 8. **Risks & Mitigation** - Challenges and solutions
 9. **Conclusion** - Summary and next steps
 
-Execute the web search NOW, then write the full proposal. Return the complete proposal text."""
+Execute the web search NOW, then write the full proposal. Return the complete proposal text.
+
+Topic: """
+
+# Input limits for /generate, checked before any OpenClaw call is made
+GENERATE_MAX_BODY_BYTES = 64 * 1024
+PROPOSAL_TOPIC_MAX_CHARS = 16000
+
+# Prompt for the legacy /research endpoint, filled with the topic and the
+# per-job output filename.
+RESEARCH_PROMPT_TEMPLATE = (
+    "Research the following topic: '{topic}'. "
+    "Then, create a PowerPoint presentation with 5 slides summarizing your findings. "
+    "Write a Python script that uses the python-pptx library. "
+    "The script should create slides with titles and bullet points. "
+    "Save the file as '{file_name}'. "
+    "Execute the script to generate the file. "
+    "Return a confirmation when done."
+)
+
+# OpenClaw saves files to its workspace directory
+OPENCLAW_WORKSPACE = os.path.expanduser('~/.openclaw/workspace')
+
+# Completed proposals keyed by normalized topic, so repeat submissions of the
+# same topic within the TTL skip another multi-minute OpenClaw run.
+PROPOSAL_CACHE_TTL_SECONDS = int(os.getenv("PROPOSAL_CACHE_TTL_SECONDS", "600"))
+_proposal_cache = {}
+_proposal_cache_lock = threading.Lock()
+
+
+def _proposal_cache_key(topic):
+    normalized = " ".join(topic.lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _get_cached_proposal(key):
+    with _proposal_cache_lock:
+        entry = _proposal_cache.get(key)
+        if not entry:
+            return None
+        expires_at, output = entry
+        if expires_at < time.monotonic():
+            _proposal_cache.pop(key, None)
+            return None
+        return output
+
+
+def _cache_proposal(key, output):
+    if PROPOSAL_CACHE_TTL_SECONDS <= 0:
+        return
+    with _proposal_cache_lock:
+        now = time.monotonic()
+        expired = [k for k, (expires_at, _) in _proposal_cache.items() if expires_at < now]
+        for k in expired:
+            del _proposal_cache[k]
+        _proposal_cache[key] = (now + PROPOSAL_CACHE_TTL_SECONDS, output)
+
+
+# Proposal jobs currently in progress, keyed like the cache. Concurrent requests
+# for the same topic are handed the running job's id and poll its result,
+# instead of starting another run or holding a pool worker while they wait.
+PROPOSAL_TIMEOUT_SECONDS = 180
+_proposal_inflight = {}
+
+
+def _submit_proposal_job(topic, cache_key):
+    """Return the job id generating this topic's proposal, starting one if none is running."""
+    with _proposal_cache_lock:
+        job_id = _proposal_inflight.get(cache_key)
+        if job_id is not None:
+            return job_id
+        job_id = _submit_job(_run_generate_job, topic, cache_key)
+        _proposal_inflight[cache_key] = job_id
+
+    def _forget(_future):
+        with _proposal_cache_lock:
+            if _proposal_inflight.get(cache_key) == job_id:
+                del _proposal_inflight[cache_key]
+
+    # Registered outside the lock: a job that already finished runs the
+    # callback right here.
+    with _jobs_lock:
+        future = _jobs[job_id]["future"]
+    future.add_done_callback(_forget)
+    return job_id
+
+# Configure CORS. flask_cors answers preflight requests and sets the
+# Access-Control-* headers on every response from an allowed origin.
+ALLOWED_ORIGINS = frozenset({"http://localhost:5173", "http://localhost:5174"})
+CORS(app, 
+    origins=sorted(ALLOWED_ORIGINS),
+    allow_headers=["Content-Type"],
+    methods=["GET", "POST", "DELETE", "OPTIONS"])
+
+# Gzip JSON bodies of 1 KB or more (proposals, workflow lists) for clients that
+# accept it. Registered by hand so endpoints in COMPRESS_EXEMPT_ENDPOINTS keep
+# their own conditional-GET handling: Flask-Compress rewrites strong ETags.
+app.config.update(
+    COMPRESS_REGISTER=False,
+    COMPRESS_MIMETYPES=["application/json"],
+    COMPRESS_ALGORITHM=["gzip"],
+    COMPRESS_LEVEL=5,
+    COMPRESS_MIN_SIZE=1024,
+)
+compress = Compress(app)
+COMPRESS_EXEMPT_ENDPOINTS = frozenset({"check_ppt_status"})
+
+
+@app.after_request
+def compress_response(response):
+    if request.endpoint in COMPRESS_EXEMPT_ENDPOINTS:
+        return response
+    return compress.after_request(response)
+
+# Register the workflow API blueprint
+app.register_blueprint(workflow_bp)
+
+# Return the request's scoped DB session to the pool once the response is done
+@app.teardown_appcontext
+def remove_db_session(exception=None):
+    SessionLocal.remove()
+
+# How long /research waits for OpenClaw to finish writing the PPTX after the
+# agent reports success, and how often it checks.
+RESEARCH_OUTPUT_WAIT_SECONDS = 10
+RESEARCH_OUTPUT_POLL_INTERVAL_SECONDS = 0.1
+
+
+def _wait_for_file(path, timeout, interval=RESEARCH_OUTPUT_POLL_INTERVAL_SECONDS):
+    """Return True as soon as path exists, or False once timeout elapses."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.stat(path)
+            return True
+        except FileNotFoundError:
+            pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+
+# /generate and /research jobs run on a small worker pool so the request thread
+# is not held for the multi-minute OpenClaw run. Jobs are tracked in this
+# process only.
+OPENCLAW_JOB_WORKERS = int(os.getenv("OPENCLAW_JOB_WORKERS", "4"))
+JOB_RETENTION_SECONDS = 3600
+RESEARCH_BATCH_MAX_TOPICS = 10
+_job_executor = ThreadPoolExecutor(max_workers=OPENCLAW_JOB_WORKERS, thread_name_prefix="openclaw-job")
+_jobs = {}
+_jobs_lock = threading.Lock()
+
+
+def _submit_job(run, *args):
+    """
+    Queue run(job_id, *args) on the worker pool and return the job id.
+    run must return a (body, status_code) tuple.
+    """
+    job_id = generate_session_id()
+    now = time.time()
+    with _jobs_lock:
+        # Forget finished jobs nobody has collected within the retention window
+        expired = [
+            jid for jid, job in _jobs.items()
+            if job["future"].done() and now - job["created_at"] > JOB_RETENTION_SECONDS
+        ]
+        for jid in expired:
+            del _jobs[jid]
+        _jobs[job_id] = {
+            "future": _job_executor.submit(run, job_id, *args),
+            "created_at": now
+        }
+    return job_id
 
-        # Call OpenClaw via CLI
+
+@app.route('/')
+def health_check():
+    return "OK", 200
+
+def _run_generate_job(job_id, topic, cache_key):
+    """Run one /generate job on the worker pool; returns (body, status_code)."""
+    try:
+        # Static instructions come first so every proposal request shares the
+        # same prompt prefix; only the topic varies at the end.
         result = ask_openclaw(
-            message=prompt,
+            message=f'{PROPOSAL_PROMPT_PREFIX}"{topic}"',
             session_id="proposal_session",
-            timeout=180  # 3 minutes for research
+            timeout=PROPOSAL_TIMEOUT_SECONDS
         )
 
         if not result.get("success"):
             print(f"OpenClaw error: {result.get('error', 'Unknown error')}")
-            return jsonify({'error': 'Failed to generate proposal', 'details': result.get('output', '')}), 500
+            return {'error': 'Failed to generate proposal', 'details': result.get('output', '')}, 500
 
         output = result.get('output', '').strip()
-        
-        return jsonify({
+        if output:
+            _cache_proposal(cache_key, output)
+
+        return {
             'response': output,
             'type': 'text',
             'message': 'Research proposal generated!'
-        }), 200
+        }, 200
 
     except Exception as e:
         print(f"Error generating proposal: {e}")
         import traceback
         traceback.print_exc()
-        return jsonify({'error': 'Failed to generate proposal'}), 500
+        return {'error': 'Failed to generate proposal'}, 500
 
-@app.route('/research', methods=['POST'])
-def research():
+
+# Main route to generate a research proposal as a Google Doc
+@app.route('/generate', methods=['POST'])
+def generate():
+    """
+    Start proposal generation and return immediately with a job id.
+    Cached topics are answered directly; otherwise poll GET /tasks/<job_id>.
+    """
     try:
+        # Reject oversized bodies before parsing them or starting an OpenClaw run
+        if request.content_length and request.content_length > GENERATE_MAX_BODY_BYTES:
+            return jsonify({'error': 'Request body too large'}), 413
+
         data = request.json
-        topic = data.get('topic')
+        if not data or not data.get('prompt'):
+            return jsonify({'error': 'Research topic is required'}), 400
+        if not isinstance(data['prompt'], str):
+            return jsonify({'error': 'Research topic must be a string'}), 400
+
+        topic = data['prompt'].strip()
         if not topic:
-            return jsonify({'error': 'Topic is required'}), 400
+            return jsonify({'error': 'Research topic is required'}), 400
+        if len(topic) > PROPOSAL_TOPIC_MAX_CHARS:
+            return jsonify({'error': f'Research topic must be at most {PROPOSAL_TOPIC_MAX_CHARS} characters'}), 400
+        cache_key = _proposal_cache_key(topic)
+
+        cached_output = _get_cached_proposal(cache_key)
+        if cached_output is not None:
+            return jsonify({
+                'response': cached_output,
+                'type': 'text',
+                'message': 'Research proposal generated!',
+                'cached': True
+            }), 200
+
+        job_id = _submit_proposal_job(topic, cache_key)
+
+        return jsonify({
+            'job_id': job_id,
+            'status': 'pending',
+            'message': 'Proposal generation started'
+        }), 202
+
+    except Exception as e:
+        print(f"Error generating proposal: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'error': 'Failed to generate proposal'}), 500
+
+def _run_research_job(job_id, topic):
+    """Run one /research job on the worker pool; returns (body, status_code)."""
+    try:
+        output_file_name = f"research_output_{job_id}.pptx"
+
+        prompt = RESEARCH_PROMPT_TEMPLATE.format(topic=topic, file_name=output_file_name)
 
-        # Construct the prompt
-        prompt = (
-            f"Research the following topic: '{topic}'. "
-            f"Then, create a PowerPoint presentation with 5 slides summarizing your findings. "
-            f"Write a Python script that uses the python-pptx library. "
-            f"The script should create slides with titles and bullet points. "
-            f"Save the file as 'research_output.pptx'. "
-            f"Execute the script to generate the file. "
-            f"Return a confirmation when done."
-        )
-        
         # Use CLI to communicate with OpenClaw
-        print(f"Sending request to OpenClaw via CLI...")
+        print(f"Sending research job {job_id} to OpenClaw via CLI...")
         result = ask_openclaw(
             message=prompt,
-            session_id="research_session"
+            session_id=f"research_{job_id}"
         )
-        
+
         if not result.get("success"):
             print(f"OpenClaw error: {result.get('error', 'Unknown error')}")
-            return jsonify({
+            return {
                 'error': 'OpenClaw failed to process research',
                 'details': result.get('output', '')
-            }), 500
+            }, 500
 
-        # OpenClaw saves files to its workspace directory
-        openclaw_workspace = os.path.expanduser('~/.openclaw/workspace')
-        output_path = os.path.join(openclaw_workspace, 'research_output.pptx')
-        
-        time.sleep(2)
+        output_path = os.path.join(OPENCLAW_WORKSPACE, output_file_name)
 
-        if os.path.exists(output_path):
-            return jsonify({
+        if _wait_for_file(output_path, timeout=RESEARCH_OUTPUT_WAIT_SECONDS):
+            return {
                 'message': 'Research completed and PowerPoint generated!',
-                'file_name': 'research_output.pptx',
+                'file_name': output_file_name,
                 'preview_text': result.get('summary', result.get('output', '')[:500])
-            }), 200
+            }, 200
         else:
-            return jsonify({
+            return {
                 'error': 'Research finished but no PowerPoint file was found.',
                 'log': result.get('output', ''),
                 'summary': result.get('summary', '')
-            }), 500
+            }, 500
+
+    except Exception as e:
+        print(f"Error in research job {job_id}: {e}")
+        import traceback
+        traceback.print_exc()
+        return {'error': str(e)}, 500
+
+
+@app.route('/research', methods=['POST'])
+def research():
+    """
+    Start a research job and return immediately with its id.
+    Poll GET /research/<job_id> for the result.
+    """
+    try:
+        data = request.json
+        topic = data.get('topic')
+        if not topic:
+            return jsonify({'error': 'Topic is required'}), 400
+
+        job_id = _submit_job(_run_research_job, topic)
+
+        return jsonify({
+            'job_id': job_id,
+            'status': 'pending',
+            'message': 'Research started'
+        }), 202
 
     except Exception as e:
         print(f"Error in research: {e}")
@@ -172,6 +417,62 @@ def research():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/research/batch', methods=['POST'])
+def research_batch():
+    """
+    Start one research job per topic. Jobs run concurrently on the worker pool
+    (at most OPENCLAW_JOB_WORKERS at once); poll each job id individually.
+
+    Request body:
+    {
+        "topics": ["Topic A", "Topic B"]
+    }
+    """
+    try:
+        data = request.json
+        topics = data.get('topics') if data else None
+        if not isinstance(topics, list):
+            return jsonify({'error': 'topics must be a list'}), 400
+
+        topics = [t.strip() for t in topics if isinstance(t, str) and t.strip()]
+        if not topics:
+            return jsonify({'error': 'At least one topic is required'}), 400
+        if len(topics) > RESEARCH_BATCH_MAX_TOPICS:
+            return jsonify({'error': f'At most {RESEARCH_BATCH_MAX_TOPICS} topics per batch'}), 400
+
+        jobs = [{'topic': topic, 'job_id': _submit_job(_run_research_job, topic)} for topic in topics]
+
+        return jsonify({
+            'jobs': jobs,
+            'status': 'pending',
+            'message': f'Started {len(jobs)} research job(s)'
+        }), 202
+
+    except Exception as e:
+        print(f"Error in research batch: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/tasks/<job_id>', methods=['GET'])
+@app.route('/research/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Return the result of a /generate or /research job, or 202 while it is still running."""
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+    if not job:
+        return jsonify({'error': f'Job {job_id} not found'}), 404
+
+    future = job["future"]
+    if not future.done():
+        return jsonify({'job_id': job_id, 'status': 'pending'}), 202
+
+    body, status_code = future.result()
+    body = {**body, 'job_id': job_id, 'status': 'completed' if status_code == 200 else 'error'}
+    return jsonify(body), status_code
+
+
 @app.route('/generate-ppt', methods=['POST'])
 def generate_ppt():
     """
@@ -186,6 +487,84 @@ def generate_ppt():
     }), 410
 
 
+def _scan_ppt_files():
+    """
+    Return info for every .pptx in PPT_OUTPUT_DIR, newest first.
+    The listing is rebuilt with one os.scandir pass when the directory's mtime
+    changes, and otherwise reused for up to PPT_INDEX_MAX_AGE_SECONDS so files
+    still being written get their size refreshed.
+    """
+    dir_mtime_ns = os.stat(PPT_OUTPUT_DIR).st_mtime_ns
+    now = time.monotonic()
+    with _ppt_index_lock:
+        if (
+            _ppt_index["dir_mtime_ns"] == dir_mtime_ns
+            and now - _ppt_index["scanned_at"] < PPT_INDEX_MAX_AGE_SECONDS
+        ):
+            return _ppt_index["files"]
+
+    all_files = []
+    with os.scandir(PPT_OUTPUT_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.pptx') or not entry.is_file():
+                continue
+            file_stat = entry.stat()
+            all_files.append({
+                'name': entry.name,
+                'path': entry.path,
+                'size_bytes': file_stat.st_size,
+                'created_at': file_stat.st_mtime,
+                'size_formatted': f"{file_stat.st_size / 1024:.1f} KB"
+            })
+
+    # Sort by creation time (newest first)
+    all_files.sort(key=itemgetter('created_at'), reverse=True)
+
+    with _ppt_index_lock:
+        _ppt_index.update({"dir_mtime_ns": dir_mtime_ns, "scanned_at": now, "files": all_files})
+    return all_files
+
+
+def _files_newer_than(all_files, since_timestamp):
+    """Leading run of the newest-first listing modified after since_timestamp."""
+    return list(takewhile(lambda f: f['created_at'] > since_timestamp, all_files))
+
+
+def _wait_for_new_ppt_files(since_timestamp, wait_seconds):
+    """
+    Block until a .pptx newer than since_timestamp appears or wait_seconds
+    elapses. Only the directory itself is stat'ed while waiting; the listing
+    is rebuilt when its mtime changes (a file was added, renamed or removed).
+    Returns (new_files, all_files).
+    """
+    deadline = time.monotonic() + wait_seconds
+    last_dir_mtime = os.stat(PPT_OUTPUT_DIR).st_mtime_ns
+    all_files = _scan_ppt_files()
+    new_files = _files_newer_than(all_files, since_timestamp)
+
+    while not new_files and time.monotonic() < deadline:
+        time.sleep(PPT_STATUS_POLL_INTERVAL_SECONDS)
+        dir_mtime = os.stat(PPT_OUTPUT_DIR).st_mtime_ns
+        if dir_mtime == last_dir_mtime:
+            continue
+        last_dir_mtime = dir_mtime
+        all_files = _scan_ppt_files()
+        new_files = _files_newer_than(all_files, since_timestamp)
+
+    return new_files, all_files
+
+
+def _ppt_status_etag(since_timestamp, all_files):
+    """
+    Validator for a /check-ppt-status body: it changes whenever the listing
+    (names, sizes, mtimes) or the `since` cutoff does.
+    """
+    digest = hashlib.sha1(repr(since_timestamp).encode())
+    for f in all_files:
+        digest.update(f"{f['name']}\0{f['size_bytes']}\0{f['created_at']}\n".encode())
+    return digest.hexdigest()
+
+
 @app.route('/check-ppt-status', methods=['GET'])
 def check_ppt_status():
     """
@@ -194,9 +573,13 @@ def check_ppt_status():
     
     Query params:
         - since: Unix timestamp to check for files created after this time
+        - wait: Optional seconds (max 25) to hold the request open until a new
+          file appears, so clients can long-poll instead of re-polling
     """
     try:
         since_timestamp = request.args.get('since', type=float, default=0)
+        wait_seconds = request.args.get('wait', type=float, default=0)
+        wait_seconds = min(max(wait_seconds, 0), PPT_STATUS_MAX_WAIT_SECONDS)
         
         if not os.path.exists(PPT_OUTPUT_DIR):
             return jsonify({
@@ -205,47 +588,32 @@ def check_ppt_status():
                 'message': 'Output directory does not exist yet'
             }), 200
         
-        # Get all .pptx files in the output directory
-        all_files = []
-        new_files = []
-        
-        for filename in os.listdir(PPT_OUTPUT_DIR):
-            if filename.endswith('.pptx'):
-                filepath = os.path.join(PPT_OUTPUT_DIR, filename)
-                file_stat = os.stat(filepath)
-                file_info = {
-                    'name': filename,
-                    'path': filepath,
-                    'size_bytes': file_stat.st_size,
-                    'created_at': file_stat.st_mtime,
-                    'size_formatted': f"{file_stat.st_size / 1024:.1f} KB"
-                }
-                all_files.append(file_info)
-                
-                # Check if file was created after the start timestamp
-                if file_stat.st_mtime > since_timestamp:
-                    new_files.append(file_info)
-        
-        # Sort by creation time (newest first)
-        all_files.sort(key=lambda x: x['created_at'], reverse=True)
-        new_files.sort(key=lambda x: x['created_at'], reverse=True)
-        
-        if new_files:
-            return jsonify({
+        new_files, all_files = _wait_for_new_ppt_files(since_timestamp, wait_seconds)
+
+        # Short-polling clients revalidate with If-None-Match; answer 304
+        # without re-encoding the listing when nothing changed.
+        etag = _ppt_status_etag(since_timestamp, all_files)
+        if etag in request.if_none_match:
+            response = app.response_class(status=304)
+        elif new_files:
+            response = jsonify({
                 'status': 'completed',
                 'files': new_files,
                 'all_files': all_files,
                 'message': f'Found {len(new_files)} new PowerPoint file(s)!',
                 'output_directory': PPT_OUTPUT_DIR
-            }), 200
+            })
         else:
-            return jsonify({
+            response = jsonify({
                 'status': 'pending',
                 'files': [],
                 'all_files': all_files,
                 'message': 'No new files yet. Still generating...',
                 'output_directory': PPT_OUTPUT_DIR
-            }), 200
+            })
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
             
     except Exception as e:
         print(f"Error checking PPT status: {e}")
@@ -255,17 +623,16 @@ def check_ppt_status():
         }), 500
 
 
-# Add OPTIONS handler for the new endpoint
-@app.route('/check-ppt-status', methods=['OPTIONS'])
-@app.route('/open-output-dir', methods=['OPTIONS'])
-def handle_check_ppt_options():
-    response = make_response()
-    origin = request.headers.get('Origin')
-    if origin in ["http://localhost:5173", "http://localhost:5174"]:
-        response.headers['Access-Control-Allow-Origin'] = origin
-    response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
-    response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
-    return response
+# 'open' normally hands the path to Finder and exits at once; wait this long
+# for it so failures can still be reported, then let it finish in the background.
+OPEN_OUTPUT_DIR_WAIT_SECONDS = 1.0
+
+
+def _reap_open_process(proc: subprocess.Popen):
+    """Background thread: wait for a slow 'open' so it never lingers as a zombie."""
+    _, stderr = proc.communicate()
+    if proc.returncode != 0:
+        print(f"Error opening output directory: {stderr.strip()}")
 
 
 @app.route('/open-output-dir', methods=['POST'])
@@ -274,23 +641,40 @@ def open_output_dir():
     Open the PPT output directory in the system file explorer (Finder on macOS).
     """
     try:
-        if not os.path.exists(PPT_OUTPUT_DIR):
+        # Created at startup; only recreate it if it was removed since
+        if not os.path.isdir(PPT_OUTPUT_DIR):
             os.makedirs(PPT_OUTPUT_DIR, exist_ok=True)
         
         # Use 'open' command on macOS to open Finder at the directory
-        result = subprocess.run(['open', PPT_OUTPUT_DIR], capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            return jsonify({
-                'success': True,
-                'message': f'Opened {PPT_OUTPUT_DIR} in Finder',
-                'directory': PPT_OUTPUT_DIR
-            }), 200
-        else:
+        try:
+            proc = subprocess.Popen(
+                ['open', PPT_OUTPUT_DIR],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+        except FileNotFoundError:
             return jsonify({
                 'success': False,
-                'error': f'Failed to open directory: {result.stderr}'
+                'error': "Failed to open directory: the 'open' command is not available"
             }), 500
+
+        try:
+            _, stderr = proc.communicate(timeout=OPEN_OUTPUT_DIR_WAIT_SECONDS)
+        except subprocess.TimeoutExpired:
+            threading.Thread(target=_reap_open_process, args=(proc,), daemon=True).start()
+        else:
+            if proc.returncode != 0:
+                return jsonify({
+                    'success': False,
+                    'error': f'Failed to open directory: {stderr}'
+                }), 500
+        
+        return jsonify({
+            'success': True,
+            'message': f'Opened {PPT_OUTPUT_DIR} in Finder',
+            'directory': PPT_OUTPUT_DIR
+        }), 200
             
     except Exception as e:
         print(f"Error opening output directory: {e}")
@@ -301,4 +685,5 @@ def open_output_dir():
 
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Local development only; use gunicorn (see README) for concurrent serving.
+    app.run(host='0.0.0.0', port=5000, debug=os.getenv("FLASK_DEBUG") == "1")
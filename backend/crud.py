@@ -1,7 +1,19 @@
 # crud.py
 # Database CRUD operations for the AIXplore Capability Exchange
 
-from sqlalchemy.orm import Session
+import atexit
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from sqlalchemy import bindparam, insert, inspect, or_, select, update
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload, sessionmaker
+from sqlalchemy.orm.session import make_transient_to_detached
+from database import engine
+from database.config import is_in_memory_sqlite
 from database.models import (
     User, Workflow, WorkflowStep, WorkflowEvent,
     WorkflowMessage, WorkflowApproval,
@@ -9,6 +21,135 @@ from database.models import (
 )
 
 
+# Step statuses that still need attention. The filter is built once and its
+# values are rendered inline (literal_execute), so the compiled statement is
+# cached and SQLite can match the ix_active_steps partial index.
+ACTIVE_STEP_STATUSES = ("pending", "in_progress", "awaiting_input")
+ACTIVE_STEP_FILTER = WorkflowStep.status.in_(
+    bindparam("active_step_statuses", ACTIVE_STEP_STATUSES, expanding=True, literal_execute=True)
+)
+
+
+# ──────────────────────────────────────
+# Transaction Helpers
+# ──────────────────────────────────────
+
+@contextmanager
+def batched_writes(db: Session):
+    """
+    Group several CRUD writes into one transaction. Inside the block the
+    helpers below flush instead of committing, and a single commit runs on
+    exit (rollback if the block raises). Blocks may be nested.
+    """
+    db.info["defer_commit"] = db.info.get("defer_commit", 0) + 1
+    try:
+        yield db
+    except Exception:
+        db.info["defer_commit"] -= 1
+        if not db.info["defer_commit"]:
+            db.rollback()
+        raise
+    db.info["defer_commit"] -= 1
+    if not db.info["defer_commit"]:
+        db.commit()
+
+
+def _commit(db: Session) -> None:
+    """Commit, or just flush when inside batched_writes()."""
+    if db.info.get("defer_commit"):
+        db.flush()
+    else:
+        db.commit()
+
+
+def _persist(db: Session, obj):
+    """
+    Add `obj` and commit it, refreshing it afterwards. Inside batched_writes()
+    it is only flushed; the INSERT's RETURNING clause already fills in the
+    primary key and server defaults, so no refresh SELECT is issued.
+    """
+    db.add(obj)
+    if db.info.get("defer_commit"):
+        db.flush()
+    else:
+        db.commit()
+        db.refresh(obj)
+    return obj
+
+
+def _update_returning(db: Session, model, pk: int, **values):
+    """
+    Apply `values` to one row with a single UPDATE ... RETURNING and commit,
+    returning the identity-map instance. Inside batched_writes() it keeps the
+    RETURNING values, so reading it back costs nothing. A real commit expires
+    it like any other instance, and the next attribute access reloads the row.
+    """
+    # Flush first so pending edits on the same instance are not overwritten
+    # by the RETURNING row (no-op when nothing is dirty).
+    db.flush()
+    obj = db.execute(
+        update(model)
+        .where(model.id == pk)
+        .values(**values)
+        .returning(model),
+        execution_options={"populate_existing": True},
+    ).scalar_one_or_none()
+    if obj is not None:
+        _commit(db)
+    return obj
+
+
+# ──────────────────────────────────────
+# User Cache
+# ──────────────────────────────────────
+
+# User rows are seeded once and effectively static, so lookups are served from
+# an in-process TTL cache. Column values are cached rather than ORM instances
+# (which are bound to the session that loaded them) and merged back into the
+# caller's session on a hit without touching the database.
+USER_CACHE_TTL_SECONDS = 60
+USER_CACHE_MAX_ENTRIES = 4096
+_user_cache: dict[tuple, tuple[float, dict]] = {}
+_user_cache_lock = threading.Lock()
+
+
+def _cached_user(db: Session, key: tuple) -> User | None:
+    with _user_cache_lock:
+        entry = _user_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > USER_CACHE_TTL_SECONDS:
+            del _user_cache[key]
+            return None
+        columns = entry[1]
+    # A user already in this session wins: merging the cached (possibly
+    # stale) columns over it would silently undo in-session changes.
+    user = db.identity_map.get(inspect(User).identity_key_from_primary_key((columns["id"],)))
+    if user is not None:
+        return user
+    user = User(**columns)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def _cache_user(user: User | None) -> None:
+    if user is None:
+        return
+    columns = {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    entry = (time.monotonic(), columns)
+    with _user_cache_lock:
+        if len(_user_cache) >= USER_CACHE_MAX_ENTRIES:
+            _user_cache.clear()
+        _user_cache[("id", user.id)] = entry
+        _user_cache[("email", user.email)] = entry
+
+
+def invalidate_user_cache() -> None:
+    """Drop cached users; call after changing a user row outside create_user."""
+    with _user_cache_lock:
+        _user_cache.clear()
+
+
 # ──────────────────────────────────────
 # User Operations
 # ──────────────────────────────────────
@@ -22,22 +163,57 @@ def create_user(db: Session, user_data: dict) -> User:
         is_agent=user_data.get('is_agent', False),
         is_active=user_data.get('is_active', True),
     )
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    _persist(db, new_user)
+    invalidate_user_cache()
     return new_user
 
 
 def get_user_by_id(db: Session, user_id: int) -> User | None:
-    return db.query(User).filter(User.id == user_id).first()
+    user = _cached_user(db, ("id", user_id))
+    if user is None:
+        user = db.get(User, user_id)
+        _cache_user(user)
+    return user
 
 
 def get_user_by_email(db: Session, email: str) -> User | None:
-    return db.query(User).filter(User.email == email).first()
+    user = _cached_user(db, ("email", email))
+    if user is None:
+        user = db.query(User).filter(User.email == email).first()
+        _cache_user(user)
+    return user
 
 
 def get_all_users(db: Session) -> list[User]:
-    return db.query(User).filter(User.is_active == True).all()
+    return db.scalars(select(User).where(User.is_active == True)).all()
+
+
+USER_LIST_COLUMNS = (
+    User.id, User.name, User.email, User.role, User.slack_user_id,
+    User.is_agent, User.is_active, User.created_at,
+)
+
+
+def get_active_user_rows(db: Session) -> list[dict]:
+    """
+    Active users as plain column dicts (same keys as User.to_dict()) for
+    read-only listing; skips ORM instance hydration and identity-map bookkeeping.
+    """
+    return [
+        dict(row)
+        for row in db.execute(select(*USER_LIST_COLUMNS).where(User.is_active == True)).mappings()
+    ]
+
+
+def get_user_id_by_slack_id(db: Session, slack_user_id: str) -> int | None:
+    """Map a Slack user to an active internal user id with a single-column query."""
+    if not slack_user_id:
+        return None
+    return db.scalar(
+        select(User.id)
+        .where(User.slack_user_id == slack_user_id, User.is_active == True)
+        .limit(1)
+    )
 
 
 # ──────────────────────────────────────
@@ -56,19 +232,55 @@ def create_workflow(db: Session, user_id: int, title: str,
         openclaw_session_id=openclaw_session_id,
         parent_id=parent_id,
     )
-    db.add(workflow)
-    db.commit()
-    db.refresh(workflow)
-    return workflow
+    return _persist(db, workflow)
 
 
 def get_workflow_by_id(db: Session, workflow_id: int) -> Workflow | None:
-    return db.query(Workflow).filter(Workflow.id == workflow_id).first()
+    return db.get(Workflow, workflow_id)
+
+
+# Relationships read by Workflow.to_dict(), including the user nested in each
+# child row. Collections use one IN (...) query each (selectinload) to avoid a
+# joined Cartesian product; single-valued users are joined into those queries.
+WORKFLOW_SUMMARY_LOAD_OPTIONS = (
+    joinedload(Workflow.owner),
+    selectinload(Workflow.steps).joinedload(WorkflowStep.assignee),
+    selectinload(Workflow.events).joinedload(WorkflowEvent.actor),
+)
+# Summary serialization (to_dict(summary=True)) skips messages and approvals.
+WORKFLOW_LIST_LOAD_OPTIONS = WORKFLOW_SUMMARY_LOAD_OPTIONS + (
+    selectinload(Workflow.messages).joinedload(WorkflowMessage.sender),
+    selectinload(Workflow.approvals).joinedload(WorkflowApproval.user),
+)
+
+
+# Everything else on the workflow raises instead of lazy-loading, so a new
+# serialized relationship without a matching eager load fails fast.
+WORKFLOW_DETAIL_LOAD_OPTIONS = WORKFLOW_LIST_LOAD_OPTIONS + (raiseload("*"),)
+
+
+def get_workflow_detail_by_id(db: Session, workflow_id: int) -> Workflow | None:
+    """
+    Like get_workflow_by_id, but eager-loads everything to_dict() serializes.
+    Most callers already hold the workflow in this session, and loader options
+    are ignored for identity-map hits (db.get() would not even query), so the
+    row is re-selected with populate_existing to apply them either way.
+    """
+    # populate_existing overwrites unflushed edits on the instance (the
+    # session does not autoflush), so push them out first.
+    db.flush()
+    return db.execute(
+        select(Workflow)
+        .options(*WORKFLOW_DETAIL_LOAD_OPTIONS)
+        .where(Workflow.id == workflow_id)
+        .execution_options(populate_existing=True)
+    ).scalar_one_or_none()
 
 
 def get_workflows_by_user(db: Session, user_id: int) -> list[Workflow]:
     return (
         db.query(Workflow)
+        .options(*WORKFLOW_LIST_LOAD_OPTIONS)
         .filter(Workflow.user_id == user_id)
         .order_by(Workflow.created_at.desc())
         .all()
@@ -78,21 +290,52 @@ def get_workflows_by_user(db: Session, user_id: int) -> list[Workflow]:
 def get_all_workflows(db: Session) -> list[Workflow]:
     return (
         db.query(Workflow)
+        .options(*WORKFLOW_LIST_LOAD_OPTIONS)
         .order_by(Workflow.created_at.desc())
         .all()
     )
 
 
-def get_workflows_assigned_to_user(db: Session, user_id: int) -> list[Workflow]:
-    """Get workflows where the user has a step assigned to them that needs attention."""
+def get_workflows_for_participant(db: Session, user_id: int) -> list[Workflow]:
+    """
+    Workflows the user owns or has any step assigned to, newest first, loaded
+    for summary serialization. The participant check runs in SQL instead of
+    loading every workflow and filtering in Python.
+    """
+    has_step_assigned = (
+        select(WorkflowStep.id)
+        .where(
+            WorkflowStep.workflow_id == Workflow.id,
+            WorkflowStep.assigned_to == user_id
+        )
+        .exists()
+    )
     return (
         db.query(Workflow)
-        .join(WorkflowStep, Workflow.id == WorkflowStep.workflow_id)
-        .filter(
+        .options(*WORKFLOW_SUMMARY_LOAD_OPTIONS)
+        .filter(or_(Workflow.user_id == user_id, has_step_assigned))
+        .order_by(Workflow.created_at.desc())
+        .all()
+    )
+
+
+def get_workflows_assigned_to_user(db: Session, user_id: int) -> list[Workflow]:
+    """Get workflows where the user has a step assigned to them that needs attention."""
+    # An existence check rather than JOIN + DISTINCT: no dedupe pass, and the
+    # subquery stops at the first matching step.
+    has_assigned_step = (
+        select(WorkflowStep.id)
+        .where(
+            WorkflowStep.workflow_id == Workflow.id,
             WorkflowStep.assigned_to == user_id,
-            WorkflowStep.status.in_(["pending", "in_progress", "awaiting_input"])
+            ACTIVE_STEP_FILTER
         )
-        .distinct()
+        .exists()
+    )
+    return (
+        db.query(Workflow)
+        .options(*WORKFLOW_LIST_LOAD_OPTIONS)
+        .filter(has_assigned_step)
         .order_by(Workflow.updated_at.desc())
         .all()
     )
@@ -100,14 +343,10 @@ def get_workflows_assigned_to_user(db: Session, user_id: int) -> list[Workflow]:
 
 def update_workflow_status(db: Session, workflow_id: int, status: str,
                            openclaw_session_id: str = None) -> Workflow | None:
-    workflow = get_workflow_by_id(db, workflow_id)
-    if workflow:
-        workflow.status = status
-        if openclaw_session_id:
-            workflow.openclaw_session_id = openclaw_session_id
-        db.commit()
-        db.refresh(workflow)
-    return workflow
+    values = {"status": status}
+    if openclaw_session_id:
+        values["openclaw_session_id"] = openclaw_session_id
+    return _update_returning(db, Workflow, workflow_id, **values)
 
 
 def delete_workflow(db: Session, workflow: Workflow) -> None:
@@ -127,7 +366,7 @@ def delete_workflow(db: Session, workflow: Workflow) -> None:
     )
 
     db.delete(workflow)
-    db.commit()
+    _commit(db)
 
 
 # ──────────────────────────────────────
@@ -147,14 +386,11 @@ def create_workflow_step(db: Session, workflow_id: int, step_order: int,
         status="pending",
         input_data=input_data,
     )
-    db.add(step)
-    db.commit()
-    db.refresh(step)
-    return step
+    return _persist(db, step)
 
 
 def get_step_by_id(db: Session, step_id: int) -> WorkflowStep | None:
-    return db.query(WorkflowStep).filter(WorkflowStep.id == step_id).first()
+    return db.get(WorkflowStep, step_id)
 
 
 def get_active_step(db: Session, workflow_id: int) -> WorkflowStep | None:
@@ -163,7 +399,7 @@ def get_active_step(db: Session, workflow_id: int) -> WorkflowStep | None:
         db.query(WorkflowStep)
         .filter(
             WorkflowStep.workflow_id == workflow_id,
-            WorkflowStep.status.in_(["pending", "in_progress", "awaiting_input"])
+            ACTIVE_STEP_FILTER
         )
         .order_by(WorkflowStep.step_order)
         .first()
@@ -177,7 +413,7 @@ def get_active_step_by_type(db: Session, workflow_id: int, step_type: str) -> Wo
         .filter(
             WorkflowStep.workflow_id == workflow_id,
             WorkflowStep.step_type == step_type,
-            WorkflowStep.status.in_(["pending", "in_progress", "awaiting_input"])
+            ACTIVE_STEP_FILTER
         )
         .order_by(WorkflowStep.step_order.desc(), WorkflowStep.id.desc())
         .first()
@@ -187,25 +423,20 @@ def get_active_step_by_type(db: Session, workflow_id: int, step_type: str) -> Wo
 def update_step_status(db: Session, step_id: int, status: str,
                         output_data: dict = None,
                         feedback: str = None) -> WorkflowStep | None:
-    step = get_step_by_id(db, step_id)
-    if step:
-        step.status = status
-        if output_data is not None:
-            step.output_data = output_data
-        if feedback is not None:
-            step.feedback = feedback
-        db.commit()
-        db.refresh(step)
-    return step
+    values = {"status": status}
+    if output_data is not None:
+        values["output_data"] = output_data
+    if feedback is not None:
+        values["feedback"] = feedback
+    return _update_returning(db, WorkflowStep, step_id, **values)
 
 
 def increment_step_iteration(db: Session, step_id: int) -> WorkflowStep | None:
-    step = get_step_by_id(db, step_id)
-    if step:
-        step.iteration_count += 1
-        db.commit()
-        db.refresh(step)
-    return step
+    # Incremented in SQL so concurrent refinements cannot lose an iteration.
+    return _update_returning(
+        db, WorkflowStep, step_id,
+        iteration_count=WorkflowStep.iteration_count + 1
+    )
 
 
 # ──────────────────────────────────────
@@ -216,23 +447,172 @@ def create_event(db: Session, workflow_id: int, event_type: str,
                  actor_type: str = "system", step_id: int = None,
                  actor_id: int = None, channel: str = None,
                  message: str = None,
-                 metadata_json: dict = None) -> WorkflowEvent:
-    event = WorkflowEvent(
-        workflow_id=workflow_id,
-        step_id=step_id,
-        event_type=event_type,
-        actor_id=actor_id,
-        actor_type=actor_type,
-        channel=channel,
-        message=message,
-        metadata_json=metadata_json,
-    )
-    db.add(event)
-    db.flush()  # assign PK before commit so we can fetch safely afterward
-    event_id = event.id
-    db.commit()
-    # Avoid refresh-related identity-map conflicts; fetch by id after commit.
-    return db.get(WorkflowEvent, event_id) or event
+                 metadata_json: dict = None) -> SimpleNamespace:
+    """
+    Append an audit event. Events are never modified after insert, so this is
+    a plain INSERT ... RETURNING id, created_at with no ORM instance tracked
+    in the session; a lightweight read-only record of the row is returned.
+    """
+    fields = {
+        "workflow_id": workflow_id,
+        "step_id": step_id,
+        "event_type": event_type,
+        "actor_id": actor_id,
+        "actor_type": actor_type,
+        "channel": channel,
+        "message": message,
+        "metadata_json": metadata_json,
+    }
+    row = db.execute(
+        insert(WorkflowEvent)
+        .values(**fields)
+        .returning(WorkflowEvent.id, WorkflowEvent.created_at)
+    ).one()
+    _commit(db)
+    return SimpleNamespace(id=row.id, created_at=row.created_at, **fields)
+
+
+def create_events_bulk(db: Session, events: list[dict]) -> list[WorkflowEvent]:
+    """
+    Insert several events (create_event keyword dicts) as one multi-row
+    INSERT ... RETURNING and a single commit.
+    """
+    if not events:
+        return []
+    new_events = list(db.scalars(insert(WorkflowEvent).returning(WorkflowEvent), events))
+    _commit(db)
+    return new_events
+
+
+# Progress/audit events that nothing reads back within the same request can be
+# queued instead: a background writer inserts them in batches, so a burst of
+# notes from a pipeline thread costs one commit rather than one each.
+EVENT_FLUSH_INTERVAL_SECONDS = 0.05
+EVENT_FLUSH_MAX_BATCH = 100
+# How long shutdown waits for the writer to finish the batch it is holding
+EVENT_SHUTDOWN_TIMEOUT_SECONDS = 5.0
+_event_queue: queue.SimpleQueue = queue.SimpleQueue()
+_event_writer_lock = threading.Lock()
+_event_writer: threading.Thread | None = None
+_event_writer_stop = threading.Event()
+
+# The writer opens its own sessions rather than using the thread-local
+# SessionLocal registry, so it never shares a session with request code.
+_EventSession = sessionmaker(bind=engine, autoflush=False)
+
+
+def _write_event_batch(batch: list[dict]) -> None:
+    with _EventSession() as db:
+        try:
+            db.bulk_insert_mappings(WorkflowEvent, batch)
+            db.commit()
+            return
+        except Exception:
+            db.rollback()
+        # One bad row (e.g. its workflow was deleted meanwhile) fails the whole
+        # multi-row INSERT; retry row by row so the rest of the batch survives.
+        for event in batch:
+            try:
+                db.bulk_insert_mappings(WorkflowEvent, [event])
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                print(f"[Events] Failed to write queued {event.get('event_type')} event "
+                      f"for workflow {event.get('workflow_id')}: {e}")
+                import traceback
+                traceback.print_exc()
+
+
+def _drain_event_queue(first: dict | None = None) -> list[dict]:
+    """
+    Collect a batch: with `first`, wait up to EVENT_FLUSH_INTERVAL_SECONDS for
+    more events; without it, take whatever is queued right now. A None entry
+    is the shutdown wake-up from flush_queued_events() and is skipped.
+    """
+    batch = [first] if first is not None else []
+    deadline = time.monotonic() + EVENT_FLUSH_INTERVAL_SECONDS
+    while len(batch) < EVENT_FLUSH_MAX_BATCH:
+        remaining = deadline - time.monotonic()
+        try:
+            if first is None:
+                item = _event_queue.get_nowait()
+            elif remaining > 0:
+                item = _event_queue.get(timeout=remaining)
+            else:
+                break
+        except queue.Empty:
+            break
+        if item is None:
+            break
+        batch.append(item)
+    return batch
+
+
+def _event_writer_loop() -> None:
+    while not _event_writer_stop.is_set():
+        first = _event_queue.get()
+        if first is not None:
+            _write_event_batch(_drain_event_queue(first))
+
+
+@atexit.register
+def flush_queued_events() -> None:
+    """
+    Stop the writer and synchronously write everything still queued. Runs at
+    interpreter exit and from gunicorn's worker_exit hook (the writer is a
+    daemon thread, so nothing else waits for it); safe to call more than once.
+    """
+    _event_writer_stop.set()
+    writer = _event_writer
+    if writer is not None and writer.is_alive():
+        _event_queue.put(None)
+        writer.join(EVENT_SHUTDOWN_TIMEOUT_SECONDS)
+    batch = _drain_event_queue()
+    while batch:
+        _write_event_batch(batch)
+        batch = _drain_event_queue()
+
+
+def enqueue_event(workflow_id: int, event_type: str,
+                  actor_type: str = "system", step_id: int = None,
+                  actor_id: int = None, channel: str = None,
+                  message: str = None,
+                  metadata_json: dict = None) -> None:
+    """
+    Fire-and-forget variant of create_event(). The row is written by a
+    background thread within ~50 ms, outside the caller's transaction, so
+    only use it for events whose workflow/step rows are already committed
+    and that the caller does not need to read back. created_at is stamped
+    here so queued events keep their place in the timeline relative to
+    events written synchronously afterwards.
+
+    Delivery is at most once: queued events are flushed on a clean worker
+    exit, but a crash or SIGKILL loses whatever is still in memory. Once
+    shutdown has begun, and for in-memory SQLite (whose single shared
+    connection must not be used from a second thread), the row is written
+    immediately instead.
+    """
+    global _event_writer
+    event = {
+        "workflow_id": workflow_id,
+        "step_id": step_id,
+        "event_type": event_type,
+        "actor_id": actor_id,
+        "actor_type": actor_type,
+        "channel": channel,
+        "message": message,
+        "metadata_json": metadata_json,
+        "created_at": datetime.now(timezone.utc),
+    }
+    if is_in_memory_sqlite or _event_writer_stop.is_set():
+        _write_event_batch([event])
+        return
+    if _event_writer is None:
+        with _event_writer_lock:
+            if _event_writer is None:
+                _event_writer = threading.Thread(target=_event_writer_loop, daemon=True)
+                _event_writer.start()
+    _event_queue.put(event)
 
 
 def get_events_for_workflow(db: Session, workflow_id: int) -> list[WorkflowEvent]:
@@ -265,10 +645,19 @@ def create_workflow_message(
         message=message,
         metadata_json=metadata_json,
     )
-    db.add(new_message)
-    db.commit()
-    db.refresh(new_message)
-    return new_message
+    return _persist(db, new_message)
+
+
+def get_recent_messages_for_workflow(db: Session, workflow_id: int, limit: int) -> list[WorkflowMessage]:
+    """The last `limit` messages (oldest first, like Workflow.messages) with their senders."""
+    recent = db.scalars(
+        select(WorkflowMessage)
+        .options(joinedload(WorkflowMessage.sender))
+        .where(WorkflowMessage.workflow_id == workflow_id)
+        .order_by(WorkflowMessage.created_at.desc(), WorkflowMessage.id.desc())
+        .limit(limit)
+    ).all()
+    return list(reversed(recent))
 
 
 def get_messages_for_workflow(db: Session, workflow_id: int) -> list[WorkflowMessage]:
@@ -285,14 +674,14 @@ def get_messages_for_workflow(db: Session, workflow_id: int) -> list[WorkflowMes
 # ──────────────────────────────────────
 
 def get_workflow_approval(db: Session, workflow_id: int, user_id: int) -> WorkflowApproval | None:
-    return (
-        db.query(WorkflowApproval)
-        .filter(
+    # (workflow_id, user_id) is unique (uq_workflow_approval_user), so at most
+    # one row matches and no LIMIT/ordering is needed.
+    return db.execute(
+        select(WorkflowApproval).where(
             WorkflowApproval.workflow_id == workflow_id,
             WorkflowApproval.user_id == user_id
         )
-        .first()
-    )
+    ).scalar_one_or_none()
 
 
 def upsert_workflow_approval(
@@ -310,10 +699,7 @@ def upsert_workflow_approval(
             user_id=user_id,
             status=status
         )
-        db.add(approval)
-    db.commit()
-    db.refresh(approval)
-    return approval
+    return _persist(db, approval)
 
 
 def get_workflow_approvals(db: Session, workflow_id: int) -> list[WorkflowApproval]:
@@ -338,14 +724,11 @@ def create_work_request(db: Session, request_data: dict) -> WorkRequest:
         parent_workflow_id=request_data.get('parent_workflow_id'),
         status="open"
     )
-    db.add(new_request)
-    db.commit()
-    db.refresh(new_request)
-    return new_request
+    return _persist(db, new_request)
 
 
 def get_work_request_by_id(db: Session, request_id: int) -> WorkRequest | None:
-    return db.query(WorkRequest).filter(WorkRequest.id == request_id).first()
+    return db.get(WorkRequest, request_id)
 
 
 def get_all_work_requests(db: Session) -> list[WorkRequest]:
@@ -390,20 +773,12 @@ def create_volunteer(db: Session, volunteer_data: dict) -> Volunteer:
         note=volunteer_data.get('note'),
         status="pending"
     )
-    db.add(new_volunteer)
-    db.commit()
-    db.refresh(new_volunteer)
-    return new_volunteer
+    return _persist(db, new_volunteer)
 
 
 def get_volunteer_by_id(db: Session, volunteer_id: int) -> Volunteer | None:
-    return db.query(Volunteer).filter(Volunteer.id == volunteer_id).first()
+    return db.get(Volunteer, volunteer_id)
 
 
 def update_volunteer_status(db: Session, volunteer_id: int, status: str) -> Volunteer | None:
-    volunteer = get_volunteer_by_id(db, volunteer_id)
-    if volunteer:
-        volunteer.status = status
-        db.commit()
-        db.refresh(volunteer)
-    return volunteer
+    return _update_returning(db, Volunteer, volunteer_id, status=status)
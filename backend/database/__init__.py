@@ -1,9 +1,13 @@
 # database/__init__.py
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
 from .config import engine
 
 Base = declarative_base()
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Thread-local (greenlet-local under gevent) session registry. Request handlers
+# share one session per request, released by the app's teardown hook; worker
+# threads get their own and close it when they finish.
+SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
 
 
 def get_db():
@@ -2,6 +2,9 @@
 from sqlalchemy import create_engine, event
 from sqlalchemy.pool import StaticPool, QueuePool
 import os
+import threading
+import time
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables from backend/.env
@@ -14,6 +17,19 @@ DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./database/aixplore-marketpl
 is_sqlite = DATABASE_URL.startswith('sqlite')
 is_in_memory_sqlite = DATABASE_URL in ("sqlite://", "sqlite:///:memory:") or DATABASE_URL.endswith(":memory:")
 
+
+def _json_dumps(value):
+    """orjson encoder for JSON columns (SQLAlchemy expects str, orjson gives bytes)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# JSON columns (step input/output, event/message metadata) are encoded and
+# decoded with orjson instead of the stdlib json module.
+JSON_ENGINE_ARGS = {"json_serializer": _json_dumps, "json_deserializer": orjson.loads}
+
+# Compiled-statement LRU; sized so the distinct crud/route queries never evict each other.
+QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+
 if is_sqlite:
     if is_in_memory_sqlite:
         # In-memory SQLite must use one shared connection.
@@ -21,6 +37,8 @@ if is_sqlite:
             DATABASE_URL,
             poolclass=StaticPool,
             connect_args={"check_same_thread": False},
+            query_cache_size=QUERY_CACHE_SIZE,
+            **JSON_ENGINE_ARGS,
             echo=False
         )
     else:
@@ -34,7 +52,11 @@ if is_sqlite:
             pool_size=sqlite_pool_size,
             max_overflow=sqlite_max_overflow,
             pool_timeout=30,
-            pool_pre_ping=True,
+            # A local database file never drops idle connections, so skip the
+            # per-checkout liveness ping.
+            pool_pre_ping=False,
+            query_cache_size=QUERY_CACHE_SIZE,
+            **JSON_ENGINE_ARGS,
             connect_args={
                 "check_same_thread": False,
                 "timeout": 30,
@@ -46,17 +68,57 @@ if is_sqlite:
         def _set_sqlite_pragmas(dbapi_connection, _connection_record):
             cursor = dbapi_connection.cursor()
             cursor.execute("PRAGMA journal_mode=WAL")
+            # In WAL mode NORMAL is still crash-safe and skips the fsync on
+            # every commit (the WAL is synced at checkpoints instead).
+            cursor.execute("PRAGMA synchronous=NORMAL")
             cursor.execute("PRAGMA foreign_keys=ON")
             cursor.execute("PRAGMA busy_timeout=30000")
+            # 64 MB page cache per connection; temp tables/sorts stay in memory
+            cursor.execute("PRAGMA cache_size=-65536")
+            cursor.execute("PRAGMA temp_store=MEMORY")
             cursor.close()
+
+        # Keep sqlite_stat1 fresh so the planner keeps picking the right
+        # indexes as tables grow. Pooled connections are long-lived, so besides
+        # running on close, optimize is also run on checkin at most once per
+        # SQLITE_OPTIMIZE_INTERVAL_SECONDS across the pool.
+        sqlite_optimize_interval = int(os.getenv("SQLITE_OPTIMIZE_INTERVAL_SECONDS", "3600"))
+        _last_optimize = {"at": time.monotonic()}
+        _optimize_lock = threading.Lock()
+
+        def _run_sqlite_optimize(dbapi_connection):
+            try:
+                dbapi_connection.execute("PRAGMA optimize")
+            except Exception as e:
+                print(f"[DB] PRAGMA optimize failed: {e}")
+
+        @event.listens_for(engine, "checkin")
+        def _optimize_on_checkin(dbapi_connection, _connection_record):
+            if dbapi_connection is None:
+                return
+            now = time.monotonic()
+            with _optimize_lock:
+                if now - _last_optimize["at"] < sqlite_optimize_interval:
+                    return
+                _last_optimize["at"] = now
+            _run_sqlite_optimize(dbapi_connection)
+
+        @event.listens_for(engine, "close")
+        def _optimize_on_close(dbapi_connection, _connection_record):
+            _run_sqlite_optimize(dbapi_connection)
 else:
-    # PostgreSQL / other database configuration with connection pooling
+    # PostgreSQL / other database configuration with connection pooling.
+    # pool_recycle already retires connections before typical server idle
+    # timeouts; enable DB_POOL_PRE_PING only behind proxies that drop them sooner.
     engine = create_engine(
         DATABASE_URL,
         poolclass=QueuePool,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "40")),
         pool_timeout=30,
-        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_pre_ping=os.getenv("DB_POOL_PRE_PING") == "1",
+        query_cache_size=QUERY_CACHE_SIZE,
+        **JSON_ENGINE_ARGS,
         echo=False
     )
@@ -1,16 +1,31 @@
 # database/models.py
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, JSON, ForeignKey, Text, UniqueConstraint
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, JSON, ForeignKey, Text, UniqueConstraint, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
+from datetime import datetime, timezone
 from . import Base
 
 
+def _utcnow():
+    # Timestamps are set in Python so INSERT/UPDATE need not read them back;
+    # server_default stays for rows written outside the ORM.
+    return datetime.now(timezone.utc)
+
+
 class User(Base):
     """
     Pre-seeded user personas for the AIXplore Capability Exchange.
     Supports researchers, compliance experts, design reviewers, etc.
     """
     __tablename__ = "users"
+    __table_args__ = (
+        # get_all_users() only ever reads active users
+        Index(
+            "ix_users_active", "id",
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active = true"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -19,7 +34,7 @@ class User(Base):
     slack_user_id = Column(String, nullable=True)
     is_agent = Column(Boolean, default=False)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
 
     # Relationships
     workflows = relationship("Workflow", back_populates="owner", foreign_keys="Workflow.user_id")
@@ -60,12 +75,13 @@ class Workflow(Base):
     #                generating_ppt, awaiting_presentation_review, completed, failed
     openclaw_session_id = Column(String, nullable=True)
     parent_id = Column(Integer, ForeignKey("workflows.id"), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now(), onupdate=_utcnow)
 
     # Relationships
     owner = relationship("User", back_populates="workflows", foreign_keys=[user_id])
-    parent = relationship("Workflow", remote_side=[id], backref="sub_workflows")
+    parent = relationship("Workflow", remote_side=[id], back_populates="sub_workflows")
+    sub_workflows = relationship("Workflow", back_populates="parent")
     steps = relationship("WorkflowStep", back_populates="workflow", order_by="WorkflowStep.step_order",
                          cascade="all, delete-orphan")
     events = relationship("WorkflowEvent", back_populates="workflow", order_by="WorkflowEvent.created_at",
@@ -74,12 +90,14 @@ class Workflow(Base):
                             cascade="all, delete-orphan")
     approvals = relationship("WorkflowApproval", back_populates="workflow",
                              cascade="all, delete-orphan")
+    origin_request = relationship("WorkRequest", back_populates="workflow")
 
     def __repr__(self):
         return f"<Workflow(id={self.id}, type='{self.workflow_type}', status='{self.status}')>"
 
-    def to_dict(self):
-        return {
+    def to_dict(self, summary: bool = False):
+        """Serialize the workflow; summary=True omits the chat messages and approvals."""
+        data = {
             "id": self.id,
             "user_id": self.user_id,
             "workflow_type": self.workflow_type,
@@ -92,9 +110,11 @@ class Workflow(Base):
             "owner": self.owner.to_dict() if self.owner else None,
             "steps": [step.to_dict() for step in self.steps] if self.steps else [],
             "events": [event.to_dict() for event in self.events] if self.events else [],
-            "messages": [message.to_dict() for message in self.messages] if self.messages else [],
-            "approvals": [approval.to_dict() for approval in self.approvals] if self.approvals else [],
         }
+        if not summary:
+            data["messages"] = [message.to_dict() for message in self.messages] if self.messages else []
+            data["approvals"] = [approval.to_dict() for approval in self.approvals] if self.approvals else []
+        return data
 
 
 class WorkflowStep(Base):
@@ -104,6 +124,16 @@ class WorkflowStep(Base):
     Tracks the evolving content and the refinement loop history.
     """
     __tablename__ = "workflow_steps"
+    __table_args__ = (
+        Index("ix_step_workflow_order", "workflow_id", "step_order"),
+        Index("ix_step_assigned_status", "assigned_to", "status"),
+        # Only steps still needing attention; serves get_active_step(_by_type)
+        Index(
+            "ix_active_steps", "workflow_id", "step_order",
+            sqlite_where=text("status IN ('pending', 'in_progress', 'awaiting_input')"),
+            postgresql_where=text("status IN ('pending', 'in_progress', 'awaiting_input')"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     workflow_id = Column(Integer, ForeignKey("workflows.id"), nullable=False)
@@ -120,8 +150,8 @@ class WorkflowStep(Base):
     output_data = Column(JSON, nullable=True)  # JSON: summary, slide_outline, raw_research, file_path, etc.
     feedback = Column(Text, nullable=True)      # Human feedback / refinement instructions
     iteration_count = Column(Integer, default=0)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now(), onupdate=_utcnow)
 
     # Relationships
     workflow = relationship("Workflow", back_populates="steps")
@@ -156,6 +186,9 @@ class WorkflowEvent(Base):
     Tracks who did what, when, and from where (web or Slack).
     """
     __tablename__ = "workflow_events"
+    __table_args__ = (
+        Index("ix_event_workflow_created", "workflow_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     workflow_id = Column(Integer, ForeignKey("workflows.id"), nullable=False)
@@ -171,7 +204,7 @@ class WorkflowEvent(Base):
     channel = Column(String, nullable=True)  # "web", "slack", or NULL for system events
     message = Column(Text, nullable=True)
     metadata_json = Column(JSON, nullable=True)  # Additional context (e.g., Slack message_ts)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
 
     # Relationships
     workflow = relationship("Workflow", back_populates="events")
@@ -202,6 +235,9 @@ class WorkflowMessage(Base):
     Chat messages exchanged inside a workflow between humans, agent, and system.
     """
     __tablename__ = "workflow_messages"
+    __table_args__ = (
+        Index("ix_message_workflow_created", "workflow_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     workflow_id = Column(Integer, ForeignKey("workflows.id"), nullable=False)
@@ -210,7 +246,7 @@ class WorkflowMessage(Base):
     channel = Column(String, nullable=False, default="web")  # web, slack, system
     message = Column(Text, nullable=False)
     metadata_json = Column(JSON, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
 
     workflow = relationship("Workflow", back_populates="messages")
     sender = relationship("User", back_populates="messages", foreign_keys=[sender_id])
@@ -242,8 +278,8 @@ class WorkflowApproval(Base):
     workflow_id = Column(Integer, ForeignKey("workflows.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     status = Column(String, nullable=False, default="pending")  # pending, ready, approved
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now(), onupdate=_utcnow)
 
     workflow = relationship("Workflow", back_populates="approvals")
     user = relationship("User", back_populates="approvals", foreign_keys=[user_id])
@@ -274,12 +310,12 @@ class WorkRequest(Base):
     required_capabilities = Column(JSON, nullable=True)  # List of tags like ["research", "compliance"]
     status = Column(String, nullable=False, default="open")  # open, assigned, completed
     parent_workflow_id = Column(Integer, ForeignKey("workflows.id"), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
 
     # Relationships
     requester = relationship("User", foreign_keys=[requester_id])
     volunteers = relationship("Volunteer", back_populates="request", cascade="all, delete-orphan")
-    workflow = relationship("Workflow", backref="origin_request", uselist=False)
+    workflow = relationship("Workflow", back_populates="origin_request")
 
     def to_dict(self):
         return {
@@ -308,7 +344,7 @@ class Volunteer(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     note = Column(Text, nullable=True)  # Optional "Why I'm a good match"
     status = Column(String, nullable=False, default="pending")  # pending, accepted, rejected
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
 
     # Relationships
     request = relationship("WorkRequest", back_populates="volunteers")
@@ -1,5 +1,5 @@
 # database/schemas.py
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
@@ -23,8 +23,7 @@ class UserResponse(UserBase):
     is_active: bool
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ──────────────────────────────────────
@@ -47,8 +46,7 @@ class WorkflowResponse(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class WorkflowDetailResponse(WorkflowResponse):
     owner: Optional[UserResponse] = None
@@ -78,8 +76,7 @@ class WorkflowStepResponse(BaseModel):
     updated_at: Optional[datetime] = None
     assignee: Optional[UserResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ──────────────────────────────────────
@@ -99,8 +96,7 @@ class WorkflowEventResponse(BaseModel):
     created_at: Optional[datetime] = None
     actor: Optional[UserResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ──────────────────────────────────────
@@ -124,8 +120,7 @@ class WorkflowMessageResponse(BaseModel):
     created_at: Optional[datetime] = None
     sender: Optional[UserResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ──────────────────────────────────────
@@ -145,8 +140,7 @@ class WorkflowApprovalResponse(BaseModel):
     updated_at: Optional[datetime] = None
     user: Optional[UserResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ──────────────────────────────────────
@@ -188,8 +182,7 @@ class VolunteerResponse(BaseModel):
     created_at: datetime
     user: Optional[UserResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class WorkRequestResponse(WorkRequestBase):
     id: int
@@ -200,8 +193,7 @@ class WorkRequestResponse(WorkRequestBase):
     requester: Optional[UserResponse] = None
     volunteers: List[VolunteerResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Resolve forward references
 WorkflowDetailResponse.model_rebuild()
@@ -0,0 +1,32 @@
+# gunicorn.conf.py
+# Production server settings, picked up automatically by `gunicorn app:app`
+# when run from the backend directory.
+
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+
+# gevent parks each in-flight request on a greenlet while it waits on OpenClaw,
+# Slack or SlideSpeak, so one worker serves many slow requests at once.
+worker_class = "gevent"
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+
+# /generate and /research jobs are tracked in process memory, so keep a single
+# worker unless job polling is pinned to the worker that started the job.
+workers = int(os.getenv("GUNICORN_WORKERS", "1"))
+
+# OpenClaw agent runs can take up to five minutes
+timeout = 300
+
+# GEVENT makes app.py patch blocking I/O before anything else imports it, and
+# the outbound HTTP pool is sized to the connections one worker can hold.
+raw_env = [
+    "GEVENT=1",
+    f"HTTP_POOL_MAXSIZE={worker_connections}",
+]
+
+
+def worker_exit(server, worker):
+    # Write progress events still queued in memory before the worker goes away
+    from crud import flush_queued_events
+    flush_queued_events()
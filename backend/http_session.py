@@ -0,0 +1,26 @@
+"""
+Shared HTTP Session
+One pooled, keep-alive requests.Session for outbound HTTP calls
+(OpenClaw gateway hooks, SlideSpeak downloads).
+"""
+
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connection failures are retried for every method; status-based retries only
+# apply to idempotent methods (urllib3's default), so agent triggers posted
+# to the gateway are never replayed.
+_retry = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+
+# Under gunicorn+gevent this is raised to the worker's connection count so
+# concurrent greenlets don't fall back to throwaway connections.
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=_retry)
+
+SESSION = requests.Session()
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+SESSION.headers.update({"User-Agent": "az-ai-builder/1.0"})
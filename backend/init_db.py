@@ -8,6 +8,8 @@ import sys
 # Ensure the backend directory is in the path
 sys.path.insert(0, os.path.dirname(__file__))
 
+from sqlalchemy import insert, select
+
 from database.config import engine
 from database import Base, SessionLocal
 from database.models import User, Workflow, WorkflowStep, WorkflowEvent, WorkRequest, Volunteer
@@ -17,6 +19,11 @@ def create_tables():
     """Create all tables defined in models.py."""
     print("Creating database tables...")
     Base.metadata.create_all(bind=engine)
+    # create_all() skips indexes on tables that already exist; add any that
+    # were declared after the database was first created.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
     print("✅ Tables created successfully.")
 
 
@@ -24,10 +31,10 @@ def seed_users():
     """Pre-seed the database with demo personas for the Capability Exchange."""
     db = SessionLocal()
     try:
-        # Check if users already exist (idempotent seeding)
-        existing_count = db.query(User).count()
-        if existing_count > 0:
-            print(f"ℹ️  Database already has {existing_count} user(s). Skipping seed.")
+        # Check if users already exist (idempotent seeding); LIMIT 1 avoids a full COUNT(*)
+        has_users = db.execute(select(1).select_from(User).limit(1)).scalar() is not None
+        if has_users:
+            print("ℹ️  Database already has users. Skipping seed.")
             return
 
         demo_users = [
@@ -58,9 +65,10 @@ def seed_users():
             },
         ]
 
+        # Every row carries the same keys so the bulk insert runs as one executemany
         for user_data in demo_users:
-            user = User(**user_data)
-            db.add(user)
+            user_data.setdefault("is_agent", False)
+        db.execute(insert(User), demo_users)
 
         db.commit()
         print(f"✅ Seeded {len(demo_users)} personas:")
@@ -1,15 +1,146 @@
 """
-OpenClaw CLI Client
-Handles communication with OpenClaw via subprocess CLI calls.
-This is simpler and more robust than the WebSocket approach.
+OpenClaw Client
+Sends agent turns to OpenClaw and returns the reply text.
+Uses the gateway's HTTP chat-completions endpoint, by default the local gateway
+started with `openclaw gateway run`, and falls back to spawning the
+`openclaw agent` CLI per call when the gateway is unreachable, rejects the
+token, or has the endpoint disabled. Setting OPENCLAW_GATEWAY_URL to an empty
+value always uses the CLI.
 """
 
+import os
 import subprocess
-import json
+import threading
 import uuid
 
+import orjson
+import requests
+from dotenv import load_dotenv
+
+from http_session import SESSION
+
+load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '.env'))
+
+# Same gateway and token as the hook client
+from openclaw_webhook_client import OPENCLAW_HOST, OPENCLAW_PORT, OPENCLAW_TOKEN
+
+OPENCLAW_GATEWAY_URL = os.getenv("OPENCLAW_GATEWAY_URL", f"{OPENCLAW_HOST}:{OPENCLAW_PORT}").rstrip("/")
+OPENCLAW_AGENT_MODEL = os.getenv("OPENCLAW_AGENT_MODEL", "openclaw")
+
+if not OPENCLAW_GATEWAY_URL:
+    print(
+        "WARNING: OPENCLAW_GATEWAY_URL is empty; OpenClaw calls will use the CLI "
+        "fallback (one subprocess per call, expect much higher latency and CPU)."
+    )
+
 
 def ask_openclaw(message: str, session_id: str = None, timeout: int = 300, use_json: bool = True) -> dict:
+    """
+    Send a message to the OpenClaw agent and get the response.
+
+    Args:
+        message: The message/prompt to send to the agent
+        session_id: Optional session ID for conversation continuity
+        timeout: Agent timeout in seconds (default 300 = 5 minutes)
+        use_json: Whether to request JSON output from the CLI (default True)
+
+    Returns:
+        dict with 'success', 'output', and optionally 'error' keys
+    """
+    if OPENCLAW_GATEWAY_URL and not _gateway_unavailable.is_set():
+        result = _ask_openclaw_http(message, session_id=session_id, timeout=timeout)
+        if not result.get("gateway_unavailable"):
+            return result
+        print(f"OpenClaw gateway unavailable ({result['error']}); using the CLI instead")
+    return _ask_openclaw_cli(message, session_id=session_id, timeout=timeout, use_json=use_json)
+
+
+# HTTP statuses meaning the gateway cannot serve chat completions at all (bad
+# token, endpoint disabled); these calls are retried through the CLI.
+_GATEWAY_UNAVAILABLE_STATUSES = {401: "unauthorized", 403: "forbidden", 404: "endpoint disabled"}
+
+# Set once the gateway answers 404 (chat-completions endpoint disabled), so
+# later calls go straight to the CLI instead of probing it every time.
+_gateway_unavailable = threading.Event()
+
+
+def _ask_openclaw_http(message: str, session_id: str = None, timeout: int = 300) -> dict:
+    """
+    Send a message through the gateway's OpenAI-compatible chat-completions
+    endpoint over the pooled HTTP session. The OpenAI `user` field maps to a
+    stable OpenClaw session, mirroring the CLI's --session-id.
+    Results with "gateway_unavailable" set should be retried through the CLI.
+    """
+    url = f"{OPENCLAW_GATEWAY_URL}/v1/chat/completions"
+    headers = {"Content-Type": "application/json"}
+    if OPENCLAW_TOKEN:
+        headers["Authorization"] = f"Bearer {OPENCLAW_TOKEN}"
+
+    payload = {
+        "model": OPENCLAW_AGENT_MODEL,
+        "messages": [{"role": "user", "content": message}],
+        "timeoutSeconds": timeout
+    }
+    if session_id:
+        payload["user"] = session_id
+
+    try:
+        print(f"Sending OpenClaw request to {url} (session: {session_id})")
+        response = SESSION.post(url, headers=headers, data=orjson.dumps(payload), timeout=timeout + 30)
+
+        if response.status_code in _GATEWAY_UNAVAILABLE_STATUSES:
+            if response.status_code == 404:
+                _gateway_unavailable.set()
+            return {
+                "success": False,
+                "output": response.text,
+                "error": f"Gateway returned HTTP {response.status_code} "
+                         f"({_GATEWAY_UNAVAILABLE_STATUSES[response.status_code]})",
+                "gateway_unavailable": True
+            }
+
+        if response.status_code != 200:
+            print(f"OpenClaw gateway error (HTTP {response.status_code})")
+            return {
+                "success": False,
+                "output": response.text,
+                "error": f"Gateway returned HTTP {response.status_code}"
+            }
+
+        parsed = orjson.loads(response.content)
+        choices = parsed.get("choices") or []
+        output_text = ""
+        if choices:
+            output_text = (choices[0].get("message") or {}).get("content") or ""
+
+        return {
+            "success": True,
+            "output": output_text,
+            "raw": parsed
+        }
+
+    except requests.exceptions.Timeout:
+        return {
+            "success": False,
+            "output": "",
+            "error": f"Request timed out after {timeout} seconds"
+        }
+    except requests.exceptions.ConnectionError:
+        return {
+            "success": False,
+            "output": "",
+            "error": f"Could not connect to OpenClaw gateway at {OPENCLAW_GATEWAY_URL}. Is OpenClaw running?",
+            "gateway_unavailable": True
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "output": "",
+            "error": str(e)
+        }
+
+
+def _ask_openclaw_cli(message: str, session_id: str = None, timeout: int = 300, use_json: bool = True) -> dict:
     """
     Send a message to OpenClaw agent via CLI and get the response.
     
@@ -36,21 +167,24 @@ def ask_openclaw(message: str, session_id: str = None, timeout: int = 300, use_j
     try:
         print(f"Running OpenClaw command: {' '.join(cmd[:4])}...")
         
+        # Keep stdout as bytes: orjson parses them directly, so the (possibly
+        # multi-MB) reply is never decoded or copied before parsing.
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=timeout + 30  # Give subprocess a bit more time than the agent timeout
         )
+        stdout = result.stdout
+        stderr = result.stderr.decode("utf-8", errors="replace")
         
         # Check for errors
         if result.returncode != 0:
             print(f"OpenClaw CLI error (exit code {result.returncode})")
-            print(f"Stderr: {result.stderr}")
+            print(f"Stderr: {stderr}")
             return {
                 "success": False,
-                "output": result.stdout,
-                "error": result.stderr or f"Exit code {result.returncode}"
+                "output": stdout.decode("utf-8", errors="replace"),
+                "error": stderr or f"Exit code {result.returncode}"
             }
         
         # Parse JSON output if requested
@@ -58,14 +192,12 @@ def ask_openclaw(message: str, session_id: str = None, timeout: int = 300, use_j
             try:
                 # The output might have deprecation warnings before the JSON
                 # Find the JSON part (starts with { or [)
-                stdout = result.stdout.strip()
-                json_start = stdout.find('{')
+                json_start = stdout.find(b'{')
                 if json_start == -1:
-                    json_start = stdout.find('[')
+                    json_start = stdout.find(b'[')
                 
                 if json_start != -1:
-                    json_str = stdout[json_start:]
-                    parsed = json.loads(json_str)
+                    parsed = orjson.loads(memoryview(stdout)[json_start:])
                     
                     # Handle OpenClaw's actual response format
                     # The response has: result.payloads[].text
@@ -73,9 +205,10 @@ def ask_openclaw(message: str, session_id: str = None, timeout: int = 300, use_j
                     if "result" in parsed and "payloads" in parsed["result"]:
                         payloads = parsed["result"]["payloads"]
                         # Get the last (most complete) payload text
-                        for payload in payloads:
-                            if payload.get("text"):
-                                output_text = payload["text"]  # Keep overwriting to get the last one
+                        output_text = next(
+                            (payload["text"] for payload in reversed(payloads) if payload.get("text")),
+                            ""
+                        )
                     elif "reply" in parsed:
                         output_text = parsed["reply"]
                     elif "output" in parsed:
@@ -92,18 +225,18 @@ def ask_openclaw(message: str, session_id: str = None, timeout: int = 300, use_j
                     # No JSON found, return as plain text
                     return {
                         "success": True,
-                        "output": stdout
+                        "output": stdout.decode("utf-8", errors="replace").strip()
                     }
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 print(f"Failed to parse JSON: {e}")
                 return {
                     "success": True,
-                    "output": result.stdout.strip()
+                    "output": stdout.decode("utf-8", errors="replace").strip()
                 }
         else:
             return {
                 "success": True,
-                "output": result.stdout.strip()
+                "output": stdout.decode("utf-8", errors="replace").strip()
             }
             
     except subprocess.TimeoutExpired:
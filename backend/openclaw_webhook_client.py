@@ -5,15 +5,35 @@ Uses the /hooks/agent endpoint for async agent runs.
 """
 
 import requests
-import json
+import orjson
 import os
 from typing import Optional
 
+from http_session import SESSION
+
 # Default OpenClaw gateway configuration
 OPENCLAW_HOST = os.getenv("OPENCLAW_HOST", "http://127.0.0.1")
 OPENCLAW_PORT = os.getenv("OPENCLAW_PORT", "18789")
 OPENCLAW_TOKEN = os.getenv("OPENCLAW_TOKEN", "f768fadd060a1c0c4c502e6708c9d9623a5410854de2a87b")
 
+# Sent with every hook call; the pooled SESSION keeps the gateway connection alive
+HOOK_HEADERS = {
+    "Authorization": f"Bearer {OPENCLAW_TOKEN}",
+    "Content-Type": "application/json"
+}
+
+# status code -> (status, message) for hook responses that started or finished a run
+_HOOK_SUCCESS_STATUSES = {
+    202: ("accepted", "Agent task started successfully"),
+    200: ("completed", None),
+}
+
+# status code -> error message template for rejected hook calls
+_HOOK_ERROR_MESSAGES = {
+    401: "Authentication failed. Check OPENCLAW_TOKEN.",
+    400: "Invalid payload: {text}",
+}
+
 def get_openclaw_url() -> str:
     """Get the base URL for OpenClaw webhook endpoints."""
     return f"{OPENCLAW_HOST}:{OPENCLAW_PORT}"
@@ -43,11 +63,6 @@ def trigger_agent(
     """
     url = f"{get_openclaw_url()}/hooks/agent"
     
-    headers = {
-        "Authorization": f"Bearer {OPENCLAW_TOKEN}",
-        "Content-Type": "application/json"
-    }
-    
     payload = {
         "message": message,
         "wakeMode": "now",
@@ -68,43 +83,28 @@ def trigger_agent(
         payload["thinking"] = thinking
     
     try:
-        print(f"Triggering OpenClaw agent via webhook: {url}")
-        print(f"Payload: {json.dumps(payload, indent=2)}")
+        print(f"Triggering OpenClaw agent via webhook: {url} (name: {name}, session: {session_key})")
         
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        response = SESSION.post(url, headers=HOOK_HEADERS, data=orjson.dumps(payload), timeout=30)
         
-        if response.status_code == 202:
-            # Async run started successfully
-            return {
-                "success": True,
-                "status": "accepted",
-                "message": "Agent task started successfully",
-                "data": response.json() if response.text else {}
-            }
-        elif response.status_code == 200:
-            return {
-                "success": True,
-                "status": "completed",
-                "data": response.json() if response.text else {}
-            }
-        elif response.status_code == 401:
-            return {
-                "success": False,
-                "error": "Authentication failed. Check OPENCLAW_TOKEN.",
-                "status_code": response.status_code
-            }
-        elif response.status_code == 400:
-            return {
-                "success": False,
-                "error": f"Invalid payload: {response.text}",
-                "status_code": response.status_code
-            }
-        else:
-            return {
-                "success": False,
-                "error": f"Unexpected response: {response.status_code} - {response.text}",
-                "status_code": response.status_code
-            }
+        accepted = _HOOK_SUCCESS_STATUSES.get(response.status_code)
+        if accepted:
+            status, message = accepted
+            result = {"success": True, "status": status}
+            if message:
+                result["message"] = message
+            # Check the raw bytes so an empty body is never decoded or parsed
+            result["data"] = orjson.loads(response.content) if response.content else {}
+            return result
+
+        error_template = _HOOK_ERROR_MESSAGES.get(
+            response.status_code, "Unexpected response: {status_code} - {text}"
+        )
+        return {
+            "success": False,
+            "error": error_template.format(status_code=response.status_code, text=response.text),
+            "status_code": response.status_code
+        }
             
     except requests.exceptions.ConnectionError:
         return {
@@ -136,18 +136,13 @@ def wake_agent(text: str, mode: str = "now") -> dict:
     """
     url = f"{get_openclaw_url()}/hooks/wake"
     
-    headers = {
-        "Authorization": f"Bearer {OPENCLAW_TOKEN}",
-        "Content-Type": "application/json"
-    }
-    
     payload = {
         "text": text,
         "mode": mode
     }
     
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
+        response = SESSION.post(url, headers=HOOK_HEADERS, data=orjson.dumps(payload), timeout=10)
         
         if response.status_code == 200:
             return {"success": True, "message": "Agent woken successfully"}
@@ -169,4 +164,4 @@ if __name__ == "__main__":
         name="Test",
         timeout_seconds=30
     )
-    print(f"Result: {json.dumps(result, indent=2)}")
+    print(f"Result: {orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()}")
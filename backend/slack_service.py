@@ -9,8 +9,11 @@ Sends interactive messages to Slack when:
 Inbound Slack interactions (button clicks) are handled in workflow_routes.py.
 """
 
+import atexit
 import os
-import json
+import threading
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -18,6 +21,12 @@ load_dotenv()
 SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN", "")
 SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL", "")
 SLACK_CHANNEL_ID = os.getenv("SLACK_CHANNEL_ID", "")
+SLACK_NOTIFY_WORKERS = int(os.getenv("SLACK_NOTIFY_WORKERS", "2"))
+SLACK_NOTIFY_DEBOUNCE_SECONDS = float(os.getenv("SLACK_NOTIFY_DEBOUNCE_SECONDS", "0.25"))
+
+# Notifications are posted off the workflow threads so Slack latency never
+# delays step transitions or holds their DB sessions open.
+_notify_executor = ThreadPoolExecutor(max_workers=SLACK_NOTIFY_WORKERS, thread_name_prefix="slack-notify")
 
 
 def is_configured() -> bool:
@@ -30,16 +39,141 @@ def is_configured() -> bool:
     )
 
 
+# Coalesced notifications waiting for the debounce timer, keyed by coalesce_key
+_pending_notifications = {}
+_pending_lock = threading.Lock()
+_flush_timer = None
+
+
+def _run_notification(notify, args, kwargs) -> None:
+    try:
+        notify(*args, **kwargs)
+    except Exception as e:
+        print(f"[Slack] Background notification failed: {e}")
+
+
+def _take_pending_notifications() -> list:
+    global _flush_timer
+    with _pending_lock:
+        pending = list(_pending_notifications.values())
+        _pending_notifications.clear()
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+    return pending
+
+
+def _flush_pending_notifications() -> None:
+    for notify, args, kwargs in _take_pending_notifications():
+        _notify_executor.submit(_run_notification, notify, args, kwargs)
+
+
+def submit_notification(notify, *args, coalesce_key=None, **kwargs) -> None:
+    """
+    Queue a notify_* call on the background Slack pool; failures are logged, never raised.
+    With a coalesce_key, the call waits SLACK_NOTIFY_DEBOUNCE_SECONDS and only the
+    latest call per key is sent, so a burst of refinement rounds posts one message.
+    """
+    global _flush_timer
+    if coalesce_key is None or SLACK_NOTIFY_DEBOUNCE_SECONDS <= 0:
+        _notify_executor.submit(_run_notification, notify, args, kwargs)
+        return
+
+    with _pending_lock:
+        _pending_notifications[coalesce_key] = (notify, args, kwargs)
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(SLACK_NOTIFY_DEBOUNCE_SECONDS, _flush_pending_notifications)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+@atexit.register
+def _send_pending_notifications_at_exit() -> None:
+    # The executor no longer accepts work at exit, so send stragglers inline
+    for notify, args, kwargs in _take_pending_notifications():
+        _run_notification(notify, args, kwargs)
+
+
+_slack_client = None
+
+
 def _get_slack_client():
-    """Get an authenticated Slack WebClient."""
+    """Get the shared authenticated Slack WebClient (created on first use)."""
+    global _slack_client
     if not is_configured():
         return None
-    try:
-        from slack_sdk import WebClient
-        return WebClient(token=SLACK_BOT_TOKEN)
-    except ImportError:
-        print("[Slack] slack_sdk not installed. Run: pip install slack-sdk")
-        return None
+    if _slack_client is None:
+        try:
+            from slack_sdk import WebClient
+        except ImportError:
+            print("[Slack] slack_sdk not installed. Run: pip install slack-sdk")
+            return None
+        _slack_client = WebClient(token=SLACK_BOT_TOKEN)
+    return _slack_client
+
+
+# ──────────────────────────────────────
+# Block Kit templates
+# ──────────────────────────────────────
+# Static blocks are built once at import and shared (the SDK only serializes
+# them); per-call blocks copy a template and fill in the varying fields.
+
+SLACK_SUMMARY_MAX_CHARS = 800
+WEB_APP_WORKFLOW_URL = "http://localhost:5173/workflows/{workflow_id}"
+
+
+def _header_block(text: str) -> dict:
+    return {"type": "header", "text": {"type": "plain_text", "text": text}}
+
+
+def _mrkdwn_section(text: str) -> dict:
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+def _web_app_url(workflow_id: int) -> str:
+    return WEB_APP_WORKFLOW_URL.format(workflow_id=workflow_id)
+
+
+def _workflow_button_value(workflow_id: int) -> str:
+    """Compact JSON {"workflow_id": ...} for button values, formatted directly for int ids."""
+    if isinstance(workflow_id, int) and not isinstance(workflow_id, bool):
+        return f'{{"workflow_id":{workflow_id}}}'
+    return orjson.dumps({"workflow_id": workflow_id}).decode()
+
+
+_DIVIDER_BLOCK = {"type": "divider"}
+_RESEARCH_READY_HEADER = _header_block("🔬 Research Complete — Ready for Review")
+_PPT_GENERATED_HEADER = _header_block("📊 PowerPoint Generated!")
+_RESEARCH_CONTEXT_BLOCK = {
+    "type": "context",
+    "elements": [
+        {
+            "type": "mrkdwn",
+            "text": "💡 _For detailed review with slide outline and full research data, use the web app._"
+        }
+    ]
+}
+_APPROVE_BUTTON = {
+    "type": "button",
+    "text": {"type": "plain_text", "text": "✅ Approve"},
+    "style": "primary",
+    "action_id": "approve_research"
+}
+_REFINE_BUTTON = {
+    "type": "button",
+    "text": {"type": "plain_text", "text": "🔄 Request Refinement"},
+    "action_id": "refine_research"
+}
+_OPEN_WEB_APP_BUTTON = {
+    "type": "button",
+    "text": {"type": "plain_text", "text": "🌐 Open in Web App"},
+    "action_id": "open_web_app"
+}
+_VIEW_COMPLETED_BUTTON = {
+    "type": "button",
+    "text": {"type": "plain_text", "text": "🌐 View in Web App"},
+    "action_id": "view_completed"
+}
 
 
 def notify_research_complete(
@@ -58,70 +192,32 @@ def notify_research_complete(
         print(f"[Slack] Not configured — skipping notification for workflow {workflow_id}")
         return False
 
-    # Truncate summary for Slack (max ~3000 chars for a block)
-    display_summary = summary[:800] + ("..." if len(summary) > 800 else "")
+    # Truncate summary for Slack (max ~3000 chars for a block); short summaries are used as-is
+    display_summary = summary if len(summary) <= SLACK_SUMMARY_MAX_CHARS else summary[:SLACK_SUMMARY_MAX_CHARS] + "..."
 
-    header_text = (
-        f"🔄 Refinement Round {iteration} Complete"
+    header = (
+        _header_block(f"🔄 Refinement Round {iteration} Complete")
         if is_refinement
-        else "🔬 Research Complete — Ready for Review"
+        else _RESEARCH_READY_HEADER
     )
+    button_value = _workflow_button_value(workflow_id)
 
     blocks = [
-        {
-            "type": "header",
-            "text": {"type": "plain_text", "text": header_text}
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*Topic:* {topic}\n*Workflow ID:* {workflow_id}"
-            }
-        },
-        {"type": "divider"},
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*Executive Summary:*\n{display_summary}"
-            }
-        },
-        {"type": "divider"},
+        header,
+        _mrkdwn_section(f"*Topic:* {topic}\n*Workflow ID:* {workflow_id}"),
+        _DIVIDER_BLOCK,
+        _mrkdwn_section(f"*Executive Summary:*\n{display_summary}"),
+        _DIVIDER_BLOCK,
         {
             "type": "actions",
             "block_id": f"review_actions_{workflow_id}",
             "elements": [
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "✅ Approve"},
-                    "style": "primary",
-                    "action_id": "approve_research",
-                    "value": json.dumps({"workflow_id": workflow_id})
-                },
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "🔄 Request Refinement"},
-                    "action_id": "refine_research",
-                    "value": json.dumps({"workflow_id": workflow_id})
-                },
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "🌐 Open in Web App"},
-                    "url": f"http://localhost:5173/workflows/{workflow_id}",
-                    "action_id": "open_web_app"
-                }
+                {**_APPROVE_BUTTON, "value": button_value},
+                {**_REFINE_BUTTON, "value": button_value},
+                {**_OPEN_WEB_APP_BUTTON, "url": _web_app_url(workflow_id)}
             ]
         },
-        {
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": "💡 _For detailed review with slide outline and full research data, use the web app._"
-                }
-            ]
-        }
+        _RESEARCH_CONTEXT_BLOCK
     ]
 
     try:
@@ -144,31 +240,15 @@ def notify_ppt_complete(workflow_id: int, topic: str, filename: str) -> bool:
         return False
 
     blocks = [
-        {
-            "type": "header",
-            "text": {"type": "plain_text", "text": "📊 PowerPoint Generated!"}
-        },
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": (
-                    f"*Topic:* {topic}\n"
-                    f"*File:* `{filename}`\n"
-                    f"*Workflow ID:* {workflow_id}"
-                )
-            }
-        },
+        _PPT_GENERATED_HEADER,
+        _mrkdwn_section(
+            f"*Topic:* {topic}\n"
+            f"*File:* `{filename}`\n"
+            f"*Workflow ID:* {workflow_id}"
+        ),
         {
             "type": "actions",
-            "elements": [
-                {
-                    "type": "button",
-                    "text": {"type": "plain_text", "text": "🌐 View in Web App"},
-                    "url": f"http://localhost:5173/workflows/{workflow_id}",
-                    "action_id": "view_completed"
-                }
-            ]
+            "elements": [{**_VIEW_COMPLETED_BUTTON, "url": _web_app_url(workflow_id)}]
         }
     ]
 
@@ -196,12 +276,7 @@ def update_slack_message(channel: str, message_ts: str, new_text: str) -> bool:
             channel=channel,
             ts=message_ts,
             text=new_text,
-            blocks=[
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": new_text}
-                }
-            ]
+            blocks=[_mrkdwn_section(new_text)]
         )
         return True
     except Exception as e:
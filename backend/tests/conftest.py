@@ -0,0 +1,44 @@
+# tests/conftest.py
+# Point the app at a throwaway SQLite file before any backend module is imported.
+
+import os
+import sys
+import tempfile
+
+_tmp_dir = tempfile.mkdtemp(prefix="aixplore-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp_dir}/test.db"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import event
+
+from database import SessionLocal
+from database.config import engine
+import init_db
+
+init_db.create_tables()
+init_db.seed_users()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        SessionLocal.remove()
+
+
+@pytest.fixture
+def count_queries():
+    """Returns a list that collects every SQL statement run while the test is active."""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
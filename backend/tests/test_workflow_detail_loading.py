@@ -0,0 +1,66 @@
+# tests/test_workflow_detail_loading.py
+# get_workflow_detail_by_id() must eager-load everything Workflow.to_dict()
+# serializes, whether or not the workflow is already in the session.
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from crud import (
+    create_workflow, create_workflow_step, create_event,
+    create_workflow_message, get_workflow_by_id, get_workflow_detail_by_id,
+)
+
+
+@pytest.fixture
+def workflow_id(db):
+    workflow = create_workflow(db, user_id=1, title="Detail loading")
+    research = create_workflow_step(db, workflow.id, 1, "agent_research", assigned_to=4)
+    create_workflow_step(db, workflow.id, 2, "human_review", provider_type="human", assigned_to=2)
+    create_event(db, workflow_id=workflow.id, event_type="created", actor_id=1, actor_type="human")
+    create_event(db, workflow_id=workflow.id, event_type="started", step_id=research.id)
+    create_workflow_message(db, workflow_id=workflow.id, message="Hello", sender_id=1)
+    workflow_id = workflow.id
+    db.expunge_all()
+    return workflow_id
+
+
+# Workflow row (owner joined) plus one SELECT ... IN per collection.
+DETAIL_LOAD_QUERIES = 5
+
+
+def _assert_loaded(db, workflow_id, count_queries):
+    count_queries.clear()
+    workflow = get_workflow_detail_by_id(db, workflow_id)
+    assert len(count_queries) == DETAIL_LOAD_QUERIES
+
+    count_queries.clear()
+    data = workflow.to_dict()
+    assert count_queries == []
+    assert [step["step_type"] for step in data["steps"]] == ["agent_research", "human_review"]
+    assert len(data["events"]) == 2
+    assert len(data["messages"]) == 1
+    return workflow
+
+
+def test_detail_load_on_cold_session(db, workflow_id, count_queries):
+    workflow = _assert_loaded(db, workflow_id, count_queries)
+    with pytest.raises(InvalidRequestError):
+        workflow.sub_workflows
+
+
+def test_detail_load_after_get_workflow_by_id(db, workflow_id, count_queries):
+    workflow = get_workflow_by_id(db, workflow_id)
+    assert workflow is not None
+    assert _assert_loaded(db, workflow_id, count_queries) is workflow
+    with pytest.raises(InvalidRequestError):
+        workflow.sub_workflows
+
+
+def test_detail_load_sees_unflushed_edits(db, workflow_id):
+    workflow = get_workflow_by_id(db, workflow_id)
+    workflow.title = "Renamed"
+    assert get_workflow_detail_by_id(db, workflow_id).title == "Renamed"
+
+
+def test_detail_load_missing_workflow(db):
+    assert get_workflow_detail_by_id(db, 999999) is None
@@ -31,14 +31,24 @@ import hashlib
 import threading
 import shutil
 from datetime import datetime, timezone
-from flask import Blueprint, request, jsonify, send_file
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+from urllib.parse import quote as url_quote
+from flask import Blueprint, Response, request, jsonify, send_file
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import object_session
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.utils import secure_filename
 
 from database import SessionLocal
 from crud import (
-    get_all_users, get_user_by_id,
-    create_workflow, get_workflow_by_id,
-    get_all_workflows,
+    ACTIVE_STEP_STATUSES,
+    batched_writes,
+    get_active_user_rows, get_user_by_id, get_user_id_by_slack_id,
+    create_workflow, get_workflow_by_id, get_workflow_detail_by_id,
+    get_workflows_for_participant,
     delete_workflow,
     update_workflow_status,
     create_workflow_step, get_active_step,
@@ -48,7 +58,7 @@ from crud import (
     create_work_request, create_volunteer,
     get_pending_invites_for_user,
     get_volunteer_by_id,
-    create_workflow_message, get_messages_for_workflow,
+    create_workflow_message, get_messages_for_workflow, get_recent_messages_for_workflow,
     upsert_workflow_approval, get_workflow_approvals
 )
 from openclaw_client import generate_session_id
@@ -83,14 +93,29 @@ WORKFLOW_SUBMISSION_UPLOADS_DIR = os.getenv(
     os.path.join(os.path.dirname(__file__), "uploads", "workflow_submissions")
 )
 WORKFLOW_ATTACHMENT_MAX_BYTES = max(1024, _env_int("WORKFLOW_ATTACHMENT_MAX_BYTES", 15 * 1024 * 1024))
+# Room for the multipart boundaries and the small form fields sent with one file
+UPLOAD_FORM_OVERHEAD_BYTES = 64 * 1024
 WORKFLOW_ATTACHMENT_ALLOWED_EXTENSIONS = {".pdf", ".txt", ".ppt", ".pptx"}
 DOCUMENT_ATTACHMENT_EXTENSIONS = {".pdf", ".txt"}
 MAX_DOCUMENT_CONTEXT_CHARS = max(2000, _env_int("MAX_DOCUMENT_CONTEXT_CHARS", 45000))
 MAX_DOCUMENT_FILES = max(1, _env_int("MAX_DOCUMENT_FILES", 6))
+# Cache extracted PDF text in a hidden folder inside each upload dir (listings skip folders)
+WORKFLOW_DOC_CACHE = os.getenv("WORKFLOW_DOC_CACHE", "1") == "1"
+DOCUMENT_TEXT_CACHE_DIRNAME = ".text-cache"
 MARKETPLACE_REQUEST_UPLOADS_DIR = os.getenv(
     "MARKETPLACE_REQUEST_UPLOADS_DIR",
     os.path.join(os.path.dirname(__file__), "uploads", "marketplace")
 )
+# When set (e.g. "/_protected_uploads"), downloads are handed to nginx via
+# X-Accel-Redirect to <prefix>/{workflows,workflow_submissions,marketplace}/<id>/<file>
+# instead of being streamed by the app; map those to internal locations.
+UPLOADS_ACCEL_REDIRECT_PREFIX = os.getenv("UPLOADS_ACCEL_REDIRECT_PREFIX", "").rstrip("/")
+ATTACHMENT_CACHE_TTL_SECONDS = max(0, _env_int("ATTACHMENT_CACHE_TTL_SECONDS", 5))
+ATTACHMENT_CACHE_MAX_DIRS = 1024
+
+# upload dir -> (expires_at monotonic, dir st_mtime_ns, attachments)
+_attachment_cache: dict[str, tuple[float, int, list[dict]]] = {}
+_attachment_cache_lock = threading.Lock()
 
 
 def _normalize_caps(capabilities: list[str] | None) -> list[str]:
@@ -109,6 +134,23 @@ def _request_upload_dir(request_id: int) -> str:
     return os.path.join(MARKETPLACE_REQUEST_UPLOADS_DIR, str(request_id))
 
 
+def _limit_single_upload_request() -> None:
+    """
+    Cap this request's body at one attachment plus form overhead, before the
+    multipart body is touched. Werkzeug rejects a larger Content-Length up front
+    and stops reading a streamed body at the cap, so oversized uploads are never
+    parsed or spooled to disk.
+    """
+    request.max_content_length = WORKFLOW_ATTACHMENT_MAX_BYTES + UPLOAD_FORM_OVERHEAD_BYTES
+
+
+@workflow_bp.errorhandler(RequestEntityTooLarge)
+def _upload_too_large(_error):
+    return jsonify({
+        "error": f"File too large. Max allowed is {WORKFLOW_ATTACHMENT_MAX_BYTES // (1024 * 1024)} MB."
+    }), 413
+
+
 def _is_allowed_attachment(filename: str) -> bool:
     _, ext = os.path.splitext((filename or "").lower())
     return ext in WORKFLOW_ATTACHMENT_ALLOWED_EXTENSIONS
@@ -120,32 +162,102 @@ def _attachment_display_name(stored_filename: str) -> str:
     return stored_filename
 
 
+def _invalidate_attachment_cache(base_dir: str) -> None:
+    with _attachment_cache_lock:
+        _attachment_cache.pop(base_dir, None)
+
+
 def _list_attachments_in_dir(base_dir: str) -> list[dict]:
-    if not os.path.isdir(base_dir):
+    """
+    Attachments in base_dir, newest first. Listings are cached per directory for
+    ATTACHMENT_CACHE_TTL_SECONDS and reused only while the directory's mtime is
+    unchanged, so adding or removing a file is picked up on the next call.
+    """
+    try:
+        dir_mtime_ns = os.stat(base_dir).st_mtime_ns
+    except OSError:
+        _invalidate_attachment_cache(base_dir)
+        return []
+
+    now = time.monotonic()
+    with _attachment_cache_lock:
+        cached = _attachment_cache.get(base_dir)
+    if cached and cached[0] > now and cached[1] == dir_mtime_ns:
+        return list(cached[2])
+
+    attachments = _scan_attachments_dir(base_dir)
+    if ATTACHMENT_CACHE_TTL_SECONDS > 0:
+        with _attachment_cache_lock:
+            if len(_attachment_cache) >= ATTACHMENT_CACHE_MAX_DIRS:
+                for key in [k for k, entry in _attachment_cache.items() if entry[0] <= now]:
+                    del _attachment_cache[key]
+            _attachment_cache[base_dir] = (now + ATTACHMENT_CACHE_TTL_SECONDS, dir_mtime_ns, attachments)
+    return list(attachments)
+
+
+def _scan_attachments_dir(base_dir: str) -> list[dict]:
+    # One scandir pass: DirEntry carries the file type from the directory
+    # listing, so only a single stat per regular file is needed.
+    try:
+        entries = os.scandir(base_dir)
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
     attachments = []
-    for filename in os.listdir(base_dir):
-        file_path = os.path.join(base_dir, filename)
-        if not os.path.isfile(file_path):
-            continue
-        _, ext = os.path.splitext(filename.lower())
-        stat = os.stat(file_path)
-        attachments.append({
-            "filename": filename,
-            "display_name": _attachment_display_name(filename),
-            "extension": ext,
-            "size_bytes": stat.st_size,
-            "size_formatted": f"{stat.st_size / 1024:.1f} KB",
-            "uploaded_at": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat(),
-            "_path": file_path,
-            "_mtime": stat.st_mtime,
-        })
+    with entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            filename = entry.name
+            _, ext = os.path.splitext(filename.lower())
+            stat = entry.stat()
+            attachments.append({
+                "filename": filename,
+                "display_name": _attachment_display_name(filename),
+                "extension": ext,
+                "size_bytes": stat.st_size,
+                "size_formatted": f"{stat.st_size / 1024:.1f} KB",
+                "uploaded_at": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat(),
+                "_path": entry.path,
+                "_mtime": stat.st_mtime,
+            })
 
     attachments.sort(key=lambda item: item["_mtime"], reverse=True)
     return attachments
 
 
+def _save_upload(upload, target_path: str) -> os.stat_result:
+    """Write an uploaded file and return its stat from the open handle (no second path lookup)."""
+    with open(target_path, "wb") as handle:
+        upload.save(handle)
+        handle.flush()
+        stat = os.fstat(handle.fileno())
+    _invalidate_attachment_cache(os.path.dirname(target_path))
+    return stat
+
+
+def _send_upload(file_path: str, upload_kind: str, owner_id: int, stored_filename: str):
+    """
+    Send a stored upload as a download. With UPLOADS_ACCEL_REDIRECT_PREFIX the
+    app only authorizes and the proxy streams the file with sendfile(2);
+    otherwise Flask's send_file serves it (local development).
+    """
+    download_name = _attachment_display_name(stored_filename)
+    if not UPLOADS_ACCEL_REDIRECT_PREFIX:
+        return send_file(file_path, as_attachment=True, download_name=download_name)
+
+    response = Response(status=200)
+    response.headers["X-Accel-Redirect"] = (
+        f"{UPLOADS_ACCEL_REDIRECT_PREFIX}/{upload_kind}/{owner_id}/{url_quote(stored_filename)}"
+    )
+    try:
+        download_name.encode("ascii")
+        response.headers.set("Content-Disposition", "attachment", filename=download_name)
+    except UnicodeEncodeError:
+        response.headers["Content-Disposition"] = f"attachment; filename*=UTF-8''{url_quote(download_name, safe='')}"
+    return response
+
+
 def _list_workflow_attachments(workflow_id: int) -> list[dict]:
     return _list_attachments_in_dir(_workflow_upload_dir(workflow_id))
 
@@ -191,6 +303,20 @@ def _parse_json_list_field(raw_value) -> list:
     return [part.strip() for part in text.split(",") if part.strip()]
 
 
+def _upload_size(upload) -> int:
+    """
+    Size of an uploaded part. A part Content-Length that already exceeds the
+    attachment limit is returned as-is (early reject), but the header is never
+    trusted to accept a file: otherwise the spooled stream is measured.
+    """
+    if upload.content_length and upload.content_length > WORKFLOW_ATTACHMENT_MAX_BYTES:
+        return upload.content_length
+    upload.stream.seek(0, os.SEEK_END)
+    size_bytes = upload.stream.tell()
+    upload.stream.seek(0)
+    return size_bytes
+
+
 def _validate_attachments(uploads: list) -> tuple[bool, str | None]:
     for upload in uploads:
         original_name = (upload.filename or "").strip()
@@ -199,10 +325,7 @@ def _validate_attachments(uploads: list) -> tuple[bool, str | None]:
             return False, "Invalid attachment filename."
         if not _is_allowed_attachment(safe_name):
             return False, "Only .pdf, .txt, .ppt, and .pptx files are supported"
-        upload.stream.seek(0, os.SEEK_END)
-        size_bytes = upload.stream.tell()
-        upload.stream.seek(0)
-        if size_bytes > WORKFLOW_ATTACHMENT_MAX_BYTES:
+        if _upload_size(upload) > WORKFLOW_ATTACHMENT_MAX_BYTES:
             max_mb = WORKFLOW_ATTACHMENT_MAX_BYTES // (1024 * 1024)
             return False, f"Attachment '{safe_name}' exceeds max size of {max_mb} MB."
     return True, None
@@ -210,6 +333,7 @@ def _validate_attachments(uploads: list) -> tuple[bool, str | None]:
 
 def _save_attachments_to_dir(target_dir: str, uploads: list) -> list[dict]:
     os.makedirs(target_dir, exist_ok=True)
+    _invalidate_attachment_cache(target_dir)
     saved = []
     for upload in uploads:
         safe_name = secure_filename((upload.filename or "").strip())
@@ -224,8 +348,7 @@ def _save_attachments_to_dir(target_dir: str, uploads: list) -> list[dict]:
             target_path = os.path.join(target_dir, stored_name)
             suffix += 1
 
-        upload.save(target_path)
-        stat = os.stat(target_path)
+        stat = _save_upload(upload, target_path)
         saved.append({
             "filename": stored_name,
             "display_name": safe_name,
@@ -238,8 +361,28 @@ def _save_attachments_to_dir(target_dir: str, uploads: list) -> list[dict]:
     return saved
 
 
-def _copy_request_attachments_to_workflow(request_id: int, workflow_id: int) -> list[str]:
-    source_items = _list_request_attachments(request_id)
+# ioctl(FICLONE): share the source's extents on reflink filesystems (Btrfs, XFS)
+LINUX_FICLONE = 0x40049409
+
+
+def _fast_copy(src: str, dest: str) -> None:
+    """
+    Copy a file with metadata, cloning it in O(1) where the filesystem supports
+    reflinks. Otherwise shutil.copy2, which already copies in-kernel via sendfile
+    on Linux.
+    """
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as src_handle, open(dest, "wb") as dest_handle:
+                fcntl.ioctl(dest_handle.fileno(), LINUX_FICLONE, src_handle.fileno())
+            shutil.copystat(src, dest)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dest)
+
+
+def _copy_request_attachments_to_workflow(source_items: list[dict], workflow_id: int) -> list[str]:
     if not source_items:
         return []
 
@@ -258,22 +401,89 @@ def _copy_request_attachments_to_workflow(request_id: int, workflow_id: int) ->
             dest_name = f"{int(time.time())}_{suffix}__{item['display_name']}"
             dest_path = os.path.join(target_dir, dest_name)
             suffix += 1
-        shutil.copy2(src, dest_path)
+        _fast_copy(src, dest_path)
         copied_names.append(item["display_name"])
 
+    _invalidate_attachment_cache(target_dir)
     return copied_names
 
 
-def _work_request_payload(work_request) -> dict:
+def _list_request_attachments_bulk(request_ids: list[int]) -> dict[int, list[dict]]:
+    """
+    Attachments for many requests with one scandir of the marketplace upload
+    root: only requests that actually have an upload folder are listed, instead
+    of probing one path per request.
+    """
+    attachments_by_id: dict[int, list[dict]] = {request_id: [] for request_id in request_ids}
+    wanted = {str(request_id): request_id for request_id in request_ids}
+    try:
+        entries = os.scandir(MARKETPLACE_REQUEST_UPLOADS_DIR)
+    except (FileNotFoundError, NotADirectoryError):
+        return attachments_by_id
+
+    with entries:
+        for entry in entries:
+            request_id = wanted.get(entry.name)
+            if request_id is not None and entry.is_dir():
+                attachments_by_id[request_id] = _list_attachments_in_dir(entry.path)
+    return attachments_by_id
+
+
+def _work_request_payload(work_request, attachments: list[dict] | None = None) -> dict:
     payload = work_request.to_dict()
-    payload["attachments"] = _serialize_attachments(_list_request_attachments(work_request.id))
+    if attachments is None:
+        attachments = _list_request_attachments(work_request.id)
+    payload["attachments"] = _serialize_attachments(attachments)
     return payload
 
 
-def _extract_document_text(file_path: str, extension: str) -> str:
+def _document_text_cache_path(file_path: str) -> str:
+    base_dir, filename = os.path.split(file_path)
+    return os.path.join(base_dir, DOCUMENT_TEXT_CACHE_DIRNAME, f"{filename}.txt.cache")
+
+
+def _read_cached_document_text(file_path: str, stat: os.stat_result, limit: int | None) -> str | None:
+    """
+    Cached text for file_path if it was extracted from the same size/mtime and
+    covers the requested limit (header "size:mtime_ns:limit", -1 = whole file).
+    """
+    try:
+        with open(_document_text_cache_path(file_path), "r", encoding="utf-8") as handle:
+            header = handle.readline().rstrip("\n")
+            size, mtime_ns, cached_limit = (int(part) for part in header.split(":"))
+            if size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+                return None
+            if cached_limit != -1 and (limit is None or cached_limit < limit):
+                return None
+            return handle.read()
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached_document_text(file_path: str, stat: os.stat_result, limit: int | None, text: str) -> None:
+    cache_path = _document_text_cache_path(file_path)
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(f"{stat.st_size}:{stat.st_mtime_ns}:{-1 if limit is None else limit}\n")
+            handle.write(text)
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        print(f"[Documents] Could not cache extracted text for {file_path}: {exc}")
+
+
+def _extract_document_text(file_path: str, extension: str, max_chars: int | None = None) -> str:
+    """
+    Extract a document's text. With max_chars, reading stops once that much
+    text is available (plus a little slack for leading whitespace the caller
+    strips), so only the pages that can make it into the context are parsed.
+    """
+    limit = None if max_chars is None else max_chars + 1024
+
     if extension == ".txt":
         with open(file_path, "r", encoding="utf-8", errors="ignore") as handle:
-            return handle.read()
+            return handle.read() if limit is None else handle.read(limit)
 
     if extension == ".pdf":
         try:
@@ -281,14 +491,33 @@ def _extract_document_text(file_path: str, extension: str) -> str:
         except Exception as exc:
             raise RuntimeError("PDF parsing requires pypdf to be installed.") from exc
 
+        stat = os.stat(file_path) if WORKFLOW_DOC_CACHE else None
+        if stat is not None:
+            cached = _read_cached_document_text(file_path, stat, limit)
+            if cached is not None:
+                return cached
+
         reader = PdfReader(file_path)
         chunks: list[str] = []
+        total_chars = 0
+        truncated = False
         for page in reader.pages:
             try:
-                chunks.append(page.extract_text() or "")
+                chunk = page.extract_text() or ""
             except Exception:
                 continue
-        return "\n\n".join(chunk for chunk in chunks if chunk.strip())
+            if not chunk.strip():
+                continue
+            chunks.append(chunk)
+            total_chars += len(chunk) + 2
+            if limit is not None and total_chars >= limit:
+                truncated = True
+                break
+        text = "\n\n".join(chunks)
+
+        if stat is not None:
+            _write_cached_document_text(file_path, stat, limit if truncated else None, text)
+        return text
 
     return ""
 
@@ -310,7 +539,7 @@ def _build_uploaded_document_context(workflow_id: int) -> tuple[str, list[str]]:
     for item in document_attachments:
         if remaining_chars <= 0:
             break
-        text = _extract_document_text(item["_path"], item["extension"])
+        text = _extract_document_text(item["_path"], item["extension"], max_chars=remaining_chars)
         text = (text or "").strip()
         if not text:
             continue
@@ -425,8 +654,16 @@ def _get_operation_step_for_status(workflow):
     return None
 
 
+def _recent_workflow_messages(workflow, limit: int) -> list:
+    # Slice the relationship only if it is already loaded; otherwise fetch just
+    # the window instead of materializing the whole chat history.
+    if "messages" in sa_inspect(workflow).dict:
+        return workflow.messages[-limit:] if workflow.messages else []
+    return get_recent_messages_for_workflow(object_session(workflow), workflow.id, limit)
+
+
 def _build_chat_context(workflow, limit: int = 12) -> str:
-    recent_messages = workflow.messages[-limit:] if workflow.messages else []
+    recent_messages = _recent_workflow_messages(workflow, limit)
     context_lines = []
     for msg in recent_messages:
         if msg.sender_type == "system":
@@ -514,7 +751,7 @@ def _maybe_fail_stalled_workflow(db, workflow):
         f"{timeout_minutes} minutes with no progress."
     )
     op_step = _get_operation_step_for_status(workflow)
-    if op_step and op_step.status in ("pending", "in_progress", "awaiting_input"):
+    if op_step and op_step.status in ACTIVE_STEP_STATUSES:
         existing_output = op_step.output_data if isinstance(op_step.output_data, dict) else {}
         failed_output = {
             **existing_output,
@@ -553,12 +790,11 @@ def list_users():
     """List all active personas for the persona selector."""
     db = SessionLocal()
     try:
-        users = get_all_users(db)
         return jsonify({
-            "users": [u.to_dict() for u in users]
+            "users": get_active_user_rows(db)
         }), 200
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 # ──────────────────────────────────────
@@ -600,26 +836,28 @@ def create_new_workflow():
         # Generate a unique OpenClaw session ID for this workflow
         session_id = f"workflow-{generate_session_id()}"
 
-        # Create the workflow record
-        workflow = create_workflow(
-            db, user_id=user_id, title=topic,
-            workflow_type=workflow_type,
-            openclaw_session_id=session_id
-        )
+        # Workflow, first step and creation event are written in one transaction
+        with batched_writes(db):
+            # Create the workflow record
+            workflow = create_workflow(
+                db, user_id=user_id, title=topic,
+                workflow_type=workflow_type,
+                openclaw_session_id=session_id
+            )
 
-        # Create the initial research step
-        research_step = create_workflow_step(
-            db, workflow_id=workflow.id, step_order=1,
-            step_type="agent_research", provider_type="agent",
-            input_data={"topic": topic}
-        )
+            # Create the initial research step
+            research_step = create_workflow_step(
+                db, workflow_id=workflow.id, step_order=1,
+                step_type="agent_research", provider_type="agent",
+                input_data={"topic": topic}
+            )
 
-        # Log the creation event
-        create_event(
-            db, workflow_id=workflow.id, event_type="created",
-            actor_id=user_id, actor_type="human", channel="web",
-            message=f"Workflow created: {topic}"
-        )
+            # Log the creation event
+            create_event(
+                db, workflow_id=workflow.id, event_type="created",
+                actor_id=user_id, actor_type="human", channel="web",
+                message=f"Workflow created: {topic}"
+            )
 
         # Start research in a background thread
         start_research(
@@ -640,7 +878,7 @@ def create_new_workflow():
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows', methods=['GET'])
@@ -657,23 +895,19 @@ def list_workflows():
         if not user_id:
             return jsonify({"error": "user_id is required"}), 400
 
-        workflows = get_all_workflows(db)
-        workflows = [w for w in workflows if user_id in _participant_user_ids(w)]
+        workflows = get_workflows_for_participant(db, user_id)
 
         workflow_payload = []
         for workflow in workflows:
             workflow = _maybe_fail_stalled_workflow(db, workflow)
-            data = workflow.to_dict()
             # Keep list payload lightweight for polling-heavy dashboard views.
-            data.pop("messages", None)
-            data.pop("approvals", None)
-            workflow_payload.append(data)
+            workflow_payload.append(workflow.to_dict(summary=True))
 
         return jsonify({
             "workflows": workflow_payload
         }), 200
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>', methods=['GET'])
@@ -685,7 +919,7 @@ def get_workflow_detail(workflow_id):
         if not user_id:
             return jsonify({"error": "user_id is required"}), 400
 
-        workflow = get_workflow_by_id(db, workflow_id)
+        workflow = get_workflow_detail_by_id(db, workflow_id)
         if not workflow:
             return jsonify({"error": "Workflow not found"}), 404
         if user_id not in _participant_user_ids(workflow):
@@ -696,7 +930,7 @@ def get_workflow_detail(workflow_id):
             "workflow": workflow.to_dict()
         }), 200
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>/attachments', methods=['GET'])
@@ -728,7 +962,7 @@ def list_workflow_attachments(workflow_id):
         ]
         return jsonify({"attachments": payload}), 200
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>/attachments', methods=['POST'])
@@ -736,6 +970,7 @@ def upload_workflow_attachment(workflow_id):
     """Upload a local attachment (PDF/TXT/PPT/PPTX) for workflow collaboration."""
     db = SessionLocal()
     try:
+        _limit_single_upload_request()
         user_id_raw = request.form.get("user_id")
         if user_id_raw is None:
             return jsonify({"error": "user_id is required"}), 400
@@ -761,10 +996,7 @@ def upload_workflow_attachment(workflow_id):
         if not _is_allowed_attachment(safe_name):
             return jsonify({"error": "Only .pdf, .txt, .ppt, and .pptx files are supported"}), 400
 
-        upload.stream.seek(0, os.SEEK_END)
-        size_bytes = upload.stream.tell()
-        upload.stream.seek(0)
-        if size_bytes > WORKFLOW_ATTACHMENT_MAX_BYTES:
+        if _upload_size(upload) > WORKFLOW_ATTACHMENT_MAX_BYTES:
             return jsonify({
                 "error": f"File too large. Max allowed is {WORKFLOW_ATTACHMENT_MAX_BYTES // (1024 * 1024)} MB."
             }), 400
@@ -778,7 +1010,7 @@ def upload_workflow_attachment(workflow_id):
             target_path = os.path.join(_workflow_upload_dir(workflow_id), stored_name)
             suffix += 1
 
-        upload.save(target_path)
+        stat = _save_upload(upload, target_path)
 
         actor = get_user_by_id(db, user_id)
         actor_name = actor.name if actor else f"User {user_id}"
@@ -808,7 +1040,6 @@ def upload_workflow_attachment(workflow_id):
             }
         )
 
-        stat = os.stat(target_path)
         return jsonify({
             "message": "Attachment uploaded",
             "attachment": {
@@ -821,7 +1052,7 @@ def upload_workflow_attachment(workflow_id):
             }
         }), 201
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>/attachments/<path:filename>', methods=['GET'])
@@ -847,13 +1078,9 @@ def download_workflow_attachment(workflow_id, filename):
         if not os.path.isfile(file_path):
             return jsonify({"error": "Attachment not found"}), 404
 
-        return send_file(
-            file_path,
-            as_attachment=True,
-            download_name=_attachment_display_name(safe_filename)
-        )
+        return _send_upload(file_path, "workflows", workflow_id, safe_filename)
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>/submission-documents', methods=['GET'])
@@ -874,7 +1101,7 @@ def list_submission_documents(workflow_id):
         items = _list_workflow_submission_attachments(workflow_id)
         return jsonify({"documents": _serialize_attachments(items)}), 200
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>/submission-documents', methods=['POST'])
@@ -882,6 +1109,7 @@ def upload_submission_document(workflow_id):
     """Upload a local submission document for workflow delivery/review."""
     db = SessionLocal()
     try:
+        _limit_single_upload_request()
         user_id_raw = request.form.get("user_id")
         if user_id_raw is None:
             return jsonify({"error": "user_id is required"}), 400
@@ -907,10 +1135,7 @@ def upload_submission_document(workflow_id):
         if not _is_allowed_attachment(safe_name):
             return jsonify({"error": "Only .pdf, .txt, .ppt, and .pptx files are supported"}), 400
 
-        upload.stream.seek(0, os.SEEK_END)
-        size_bytes = upload.stream.tell()
-        upload.stream.seek(0)
-        if size_bytes > WORKFLOW_ATTACHMENT_MAX_BYTES:
+        if _upload_size(upload) > WORKFLOW_ATTACHMENT_MAX_BYTES:
             return jsonify({
                 "error": f"File too large. Max allowed is {WORKFLOW_ATTACHMENT_MAX_BYTES // (1024 * 1024)} MB."
             }), 400
@@ -924,7 +1149,7 @@ def upload_submission_document(workflow_id):
             target_path = os.path.join(_workflow_submission_upload_dir(workflow_id), stored_name)
             suffix += 1
 
-        upload.save(target_path)
+        stat = _save_upload(upload, target_path)
 
         actor = get_user_by_id(db, user_id)
         actor_name = actor.name if actor else f"User {user_id}"
@@ -954,7 +1179,6 @@ def upload_submission_document(workflow_id):
             }
         )
 
-        stat = os.stat(target_path)
         return jsonify({
             "message": "Submission document uploaded",
             "document": {
@@ -967,7 +1191,7 @@ def upload_submission_document(workflow_id):
             }
         }), 201
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>/submission-documents/<path:filename>', methods=['GET'])
@@ -993,13 +1217,9 @@ def download_submission_document(workflow_id, filename):
         if not os.path.isfile(file_path):
             return jsonify({"error": "Submission document not found"}), 404
 
-        return send_file(
-            file_path,
-            as_attachment=True,
-            download_name=_attachment_display_name(safe_filename)
-        )
+        return _send_upload(file_path, "workflow_submissions", workflow_id, safe_filename)
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>', methods=['DELETE'])
@@ -1041,7 +1261,7 @@ def delete_workflow_route(workflow_id):
         print(f"Error deleting workflow {workflow_id}: {e}")
         return jsonify({"error": str(e)}), 500
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 # ──────────────────────────────────────
@@ -1153,7 +1373,7 @@ def submit_review(workflow_id):
 
             return jsonify({
                 "message": f"Research approved by {user.name}! PowerPoint generation starting...",
-                "workflow": get_workflow_by_id(db, workflow_id).to_dict()
+                "workflow": get_workflow_detail_by_id(db, workflow_id).to_dict()
             }), 200
 
         elif action == "refine":
@@ -1202,7 +1422,7 @@ def submit_review(workflow_id):
 
             return jsonify({
                 "message": f"Refinement requested! OpenClaw is updating the research based on your feedback.",
-                "workflow": get_workflow_by_id(db, workflow_id).to_dict()
+                "workflow": get_workflow_detail_by_id(db, workflow_id).to_dict()
             }), 200
 
     except Exception as e:
@@ -1211,7 +1431,7 @@ def submit_review(workflow_id):
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 # ──────────────────────────────────────
@@ -1238,7 +1458,7 @@ def list_workflow_messages(workflow_id):
             "messages": [m.to_dict() for m in messages]
         }), 200
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>/messages', methods=['POST'])
@@ -1298,7 +1518,7 @@ def post_workflow_message(workflow_id):
             "agent_reply_started": agent_reply_started
         }), 201
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>/completion', methods=['POST'])
@@ -1399,10 +1619,10 @@ def update_workflow_completion(workflow_id):
 
         return jsonify({
             "message": "Completion state updated",
-            "workflow": get_workflow_by_id(db, workflow_id).to_dict()
+            "workflow": get_workflow_detail_by_id(db, workflow_id).to_dict()
         }), 200
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>/start-research', methods=['POST'])
@@ -1437,7 +1657,7 @@ def start_research_from_collaboration(workflow_id):
                 return jsonify({"error": "Research has already started for this workflow"}), 400
 
         active_step = get_active_step(db, workflow_id)
-        if active_step and active_step.status in ("pending", "in_progress", "awaiting_input"):
+        if active_step and active_step.status in ACTIVE_STEP_STATUSES:
             update_step_status(db, active_step.id, "completed")
 
         base_description = _get_request_description(workflow)
@@ -1525,10 +1745,10 @@ def start_research_from_collaboration(workflow_id):
 
         return jsonify({
             "message": "Research started from collaboration workflow.",
-            "workflow": get_workflow_by_id(db, workflow_id).to_dict()
+            "workflow": get_workflow_detail_by_id(db, workflow_id).to_dict()
         }), 202
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>/generate-ppt', methods=['POST'])
@@ -1600,10 +1820,10 @@ def generate_ppt_from_workflow_chat(workflow_id):
 
         return jsonify({
             "message": "PPT generation started from workflow chat context.",
-            "workflow": get_workflow_by_id(db, workflow_id).to_dict()
+            "workflow": get_workflow_detail_by_id(db, workflow_id).to_dict()
         }), 202
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>/retry-ppt', methods=['POST'])
@@ -1665,10 +1885,10 @@ def retry_failed_ppt_generation(workflow_id):
 
         return jsonify({
             "message": "PPT generation retry started.",
-            "workflow": get_workflow_by_id(db, workflow_id).to_dict()
+            "workflow": get_workflow_detail_by_id(db, workflow_id).to_dict()
         }), 202
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>/cancel-run', methods=['POST'])
@@ -1705,7 +1925,7 @@ def cancel_active_run(workflow_id):
         if reason:
             cancel_message = f"{cancel_message}: {reason[:180]}"
 
-        if operation_step and operation_step.status in ("pending", "in_progress", "awaiting_input"):
+        if operation_step and operation_step.status in ACTIVE_STEP_STATUSES:
             existing_output = operation_step.output_data if isinstance(operation_step.output_data, dict) else {}
             failed_output = {
                 **existing_output,
@@ -1732,10 +1952,10 @@ def cancel_active_run(workflow_id):
 
         return jsonify({
             "message": "Active run cancelled.",
-            "workflow": get_workflow_by_id(db, workflow_id).to_dict()
+            "workflow": get_workflow_detail_by_id(db, workflow_id).to_dict()
         }), 200
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/workflows/<int:workflow_id>/retry-run', methods=['POST'])
@@ -1798,7 +2018,7 @@ def retry_failed_run(workflow_id):
             )
             return jsonify({
                 "message": "PPT generation retry started.",
-                "workflow": get_workflow_by_id(db, workflow_id).to_dict()
+                "workflow": get_workflow_detail_by_id(db, workflow_id).to_dict()
             }), 202
 
         base_description = _get_request_description(workflow)
@@ -1850,10 +2070,10 @@ def retry_failed_run(workflow_id):
 
         return jsonify({
             "message": "Research retry started.",
-            "workflow": get_workflow_by_id(db, workflow_id).to_dict()
+            "workflow": get_workflow_detail_by_id(db, workflow_id).to_dict()
         }), 202
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 # ──────────────────────────────────────
@@ -1957,13 +2177,7 @@ def _process_slack_approval(workflow_id: int, slack_user_id: str,
             return
 
         # Try to map Slack user to internal user
-        from crud import get_all_users
-        users = get_all_users(db)
-        actor_id = None
-        for user in users:
-            if user.slack_user_id == slack_user_id:
-                actor_id = user.id
-                break
+        actor_id = get_user_id_by_slack_id(db, slack_user_id)
 
         # If no match, use the workflow owner as a fallback
         if not actor_id:
@@ -2010,7 +2224,7 @@ def _process_slack_approval(workflow_id: int, slack_user_id: str,
         import traceback
         traceback.print_exc()
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 # ──────────────────────────────────────
@@ -2021,108 +2235,116 @@ def _complete_marketplace_handshake(db, work_request, volunteer):
     """
     Accept a volunteer/invite and create the collaboration workflow.
     Returns (workflow, should_send_agent_kickoff, kickoff_prompt).
+    All writes are committed together when the handshake finishes; request
+    attachments are copied into the workflow only after that commit, so a
+    failed handshake leaves no orphaned files behind.
     """
-    user = volunteer.user
-    if not user:
-        raise ValueError("Selected volunteer user not found")
-
-    # 1. Update marketplace statuses
-    volunteer.status = "accepted"
-    work_request.status = "assigned"
-    for other in work_request.volunteers:
-        if other.id != volunteer.id and other.status == "pending":
-            other.status = "rejected"
-
-    # 2. Create the actual Workflow from the request
-    session_id = f"workflow-{generate_session_id()}"
-    workflow_type = _infer_workflow_type(
-        work_request.title,
-        work_request.description,
-        work_request.required_capabilities
-    )
-    requires_research = user.is_agent and _should_auto_start_agent(work_request.required_capabilities)
-    auto_start_agent = False
-
-    workflow = create_workflow(
-        db,
-        user_id=work_request.requester_id,
-        title=work_request.title,
-        workflow_type=workflow_type,
-        openclaw_session_id=session_id,
-        parent_id=work_request.parent_workflow_id
-    )
-    copied_source_documents = _copy_request_attachments_to_workflow(work_request.id, workflow.id)
-
-    # 3. Create the first step and assign it
-    if user.is_agent:
-        step_type = "agent_collaboration"
-    elif workflow_type in ("compliance_review", "design_alignment"):
-        step_type = "specialist_review"
-    else:
-        step_type = "human_research"
-    provider_type = "agent" if user.is_agent else "human"
-
-    initial_step = create_workflow_step(
-        db, workflow_id=workflow.id, step_order=1,
-        step_type=step_type, provider_type=provider_type,
-        assigned_to=user.id,
-        input_data={
-            "topic": (work_request.description or "").strip() or work_request.title,
-            "title": work_request.title,
-            "description": work_request.description,
-            "workflow_type": workflow_type,
-            "request_id": work_request.id,
-            "requires_research": requires_research,
-            "source_documents": copied_source_documents
-        }
-    )
+    with batched_writes(db):
+        user = volunteer.user
+        if not user:
+            raise ValueError("Selected volunteer user not found")
 
-    # 4. Success event
-    create_event(
-        db, workflow_id=workflow.id, event_type="created",
-        actor_id=work_request.requester_id, actor_type="human", channel="web",
-        message=f"Handshake complete! {user.name} is starting work on: {work_request.title}"
-    )
+        # 1. Update marketplace statuses
+        volunteer.status = "accepted"
+        work_request.status = "assigned"
+        for other in work_request.volunteers:
+            if other.id != volunteer.id and other.status == "pending":
+                other.status = "rejected"
 
-    # 5. Seed collaboration chat + approvals for collaborative paths
-    should_send_agent_kickoff = False
-    kickoff_prompt = (
-        "Please acknowledge the requester description for this workflow, "
-        "summarize the requirements you will follow, and ask whether they "
-        "want to refine anything before pressing 'Start Agent Research'."
-    )
+        # 2. Create the actual Workflow from the request
+        session_id = f"workflow-{generate_session_id()}"
+        workflow_type = _infer_workflow_type(
+            work_request.title,
+            work_request.description,
+            work_request.required_capabilities
+        )
+        requires_research = user.is_agent and _should_auto_start_agent(work_request.required_capabilities)
+        auto_start_agent = False
 
-    if not auto_start_agent:
-        update_step_status(db, initial_step.id, "in_progress")
-        update_workflow_status(db, workflow.id, "collaborating")
-        create_workflow_message(
+        workflow = create_workflow(
             db,
-            workflow_id=workflow.id,
-            sender_type="system",
-            channel="system",
-            message=(
-                f"{work_request.requester.name} and {user.name} are now connected. "
-                "Use this chat to collaborate, refine, and confirm completion."
-            )
+            user_id=work_request.requester_id,
+            title=work_request.title,
+            workflow_type=workflow_type,
+            openclaw_session_id=session_id,
+            parent_id=work_request.parent_workflow_id
         )
-        if requires_research:
+        source_attachments = _list_request_attachments(work_request.id)
+
+        # 3. Create the first step and assign it
+        if user.is_agent:
+            step_type = "agent_collaboration"
+        elif workflow_type in ("compliance_review", "design_alignment"):
+            step_type = "specialist_review"
+        else:
+            step_type = "human_research"
+        provider_type = "agent" if user.is_agent else "human"
+
+        initial_step = create_workflow_step(
+            db, workflow_id=workflow.id, step_order=1,
+            step_type=step_type, provider_type=provider_type,
+            assigned_to=user.id,
+            input_data={
+                "topic": (work_request.description or "").strip() or work_request.title,
+                "title": work_request.title,
+                "description": work_request.description,
+                "workflow_type": workflow_type,
+                "request_id": work_request.id,
+                "requires_research": requires_research,
+                "source_documents": [item["display_name"] for item in source_attachments]
+            }
+        )
+
+        # 4. Success event
+        create_event(
+            db, workflow_id=workflow.id, event_type="created",
+            actor_id=work_request.requester_id, actor_type="human", channel="web",
+            message=f"Handshake complete! {user.name} is starting work on: {work_request.title}"
+        )
+
+        # 5. Seed collaboration chat + approvals for collaborative paths
+        should_send_agent_kickoff = False
+        kickoff_prompt = (
+            "Please acknowledge the requester description for this workflow, "
+            "summarize the requirements you will follow, and ask whether they "
+            "want to refine anything before pressing 'Start Agent Research'."
+        )
+
+        if not auto_start_agent:
+            update_step_status(db, initial_step.id, "in_progress")
+            update_workflow_status(db, workflow.id, "collaborating")
             create_workflow_message(
                 db,
                 workflow_id=workflow.id,
                 sender_type="system",
                 channel="system",
                 message=(
-                    "Research has not started yet. Let the agent propose a first-step plan in chat, "
-                    "then requester uses 'Start Agent Research' when ready."
+                    f"{work_request.requester.name} and {user.name} are now connected. "
+                    "Use this chat to collaborate, refine, and confirm completion."
                 )
             )
-            should_send_agent_kickoff = True
+            if requires_research:
+                create_workflow_message(
+                    db,
+                    workflow_id=workflow.id,
+                    sender_type="system",
+                    channel="system",
+                    message=(
+                        "Research has not started yet. Let the agent propose a first-step plan in chat, "
+                        "then requester uses 'Start Agent Research' when ready."
+                    )
+                )
+                should_send_agent_kickoff = True
 
-    if not user.is_agent:
-        upsert_workflow_approval(db, workflow.id, work_request.requester_id, "pending")
-        upsert_workflow_approval(db, workflow.id, user.id, "pending")
+        if not user.is_agent:
+            upsert_workflow_approval(db, workflow.id, work_request.requester_id, "pending")
+            upsert_workflow_approval(db, workflow.id, user.id, "pending")
 
-    db.commit()
+    try:
+        _copy_request_attachments_to_workflow(source_attachments, workflow.id)
+    except OSError as e:
+        print(f"[Marketplace] Failed to copy request {work_request.id} attachments "
+              f"to workflow {workflow.id}: {e}")
     return workflow, should_send_agent_kickoff, kickoff_prompt
 
 
@@ -2148,7 +2370,7 @@ def list_marketplace_invites():
 
         return jsonify({"invites": invite_payload}), 200
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/marketplace', methods=['GET'])
@@ -2157,11 +2379,12 @@ def list_marketplace():
     db = SessionLocal()
     try:
         requests = get_open_work_requests(db)
+        attachments_by_id = _list_request_attachments_bulk([r.id for r in requests])
         return jsonify({
-            "requests": [_work_request_payload(r) for r in requests]
+            "requests": [_work_request_payload(r, attachments_by_id[r.id]) for r in requests]
         }), 200
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/marketplace', methods=['POST'])
@@ -2315,7 +2538,7 @@ def post_work_request():
         print(f"Error posting work request: {e}")
         return jsonify({"error": str(e)}), 500
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/marketplace/<int:request_id>', methods=['GET'])
@@ -2328,7 +2551,7 @@ def get_marketplace_detail(request_id):
             return jsonify({"error": "Request not found"}), 404
         return jsonify({"request": _work_request_payload(work_request)}), 200
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/marketplace/<int:request_id>/attachments/<path:filename>', methods=['GET'])
@@ -2348,13 +2571,9 @@ def download_marketplace_attachment(request_id, filename):
         if not os.path.isfile(file_path):
             return jsonify({"error": "Attachment not found"}), 404
 
-        return send_file(
-            file_path,
-            as_attachment=True,
-            download_name=_attachment_display_name(safe_filename)
-        )
+        return _send_upload(file_path, "marketplace", request_id, safe_filename)
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/marketplace/<int:request_id>/volunteer', methods=['POST'])
@@ -2391,7 +2610,7 @@ def volunteer_for_task(request_id):
             "volunteer": volunteer.to_dict()
         }), 201
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 @workflow_bp.route('/api/marketplace/<int:request_id>/accept', methods=['POST'])
@@ -2448,7 +2667,7 @@ def accept_volunteer(request_id):
         print(f"Error accepting volunteer: {e}")
         return jsonify({"error": str(e)}), 500
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 # ──────────────────────────────────────
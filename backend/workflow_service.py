@@ -13,23 +13,25 @@ import time
 import os
 import re
 import json
+import shutil
 import subprocess
 import zipfile
 import html
 from urllib.parse import urlparse
 from typing import Any
 
-import requests
 from database import SessionLocal
 from database.models import Workflow, WorkflowStep
 from crud import (
+    ACTIVE_STEP_STATUSES,
     get_workflow_by_id, update_workflow_status,
     create_workflow_step, get_active_step_by_type, get_step_by_id,
     update_step_status, increment_step_iteration,
-    create_event, create_workflow_message,
+    create_event, create_events_bulk, enqueue_event, create_workflow_message,
     get_user_by_email, get_work_request_by_id
 )
 from openclaw_client import ask_openclaw, generate_session_id
+from http_session import SESSION
 
 # PPT output + SlideSpeak paths (override in backend/.env for portability)
 PPT_OUTPUT_DIR = os.getenv("PPT_OUTPUT_DIR", "/Users/anubhawmathur/development/ppt-output")
@@ -43,6 +45,7 @@ SLIDESPEAK_GENERATE_TIMEOUT_SECONDS = 240
 SLIDESPEAK_STATUS_POLL_INTERVAL_SECONDS = 5
 SLIDESPEAK_COMMAND_BUFFER_SECONDS = 20
 SLIDESPEAK_DOWNLOAD_TIMEOUT_SECONDS = 60
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024
 PROMPT_RECONCILIATION_TIMEOUT_SECONDS = 120
 URL_PATTERN = re.compile(r"https?://[^\s<>\]\"')]+", re.IGNORECASE)
 NON_CITATION_URL_HOSTS = {
@@ -391,7 +394,7 @@ def _run_research_thread(
         if research_step_id:
             step = get_step_by_id(db, research_step_id)
             if (not step or step.workflow_id != workflow_id or step.step_type != "agent_research"
-                    or step.status not in ("pending", "in_progress", "awaiting_input")):
+                    or step.status not in ACTIVE_STEP_STATUSES):
                 print(f"[Workflow {workflow_id}] ERROR: Provided research step {research_step_id} is not active/valid")
                 return
         else:
@@ -457,21 +460,22 @@ def _run_research_thread(
             update_workflow_status(db, workflow_id, "awaiting_review")
 
             # Log events
-            create_event(
-                db, workflow_id=workflow_id, event_type="research_completed",
-                actor_type="agent", step_id=step.id,
-                message="Research completed successfully"
-            )
-            create_event(
-                db, workflow_id=workflow_id, event_type="review_requested",
-                actor_type="system", step_id=review_step.id,
-                message=f"Review assigned to {workflow.owner.name}"
-            )
-
-            # Attempt Slack notification (non-blocking)
+            create_events_bulk(db, [
+                dict(workflow_id=workflow_id, event_type="research_completed",
+                     actor_type="agent", step_id=step.id,
+                     message="Research completed successfully"),
+                dict(workflow_id=workflow_id, event_type="review_requested",
+                     actor_type="system", step_id=review_step.id,
+                     message=f"Review assigned to {workflow.owner.name}"),
+            ])
+
+            # Queue Slack notification (non-blocking)
             try:
-                from slack_service import notify_research_complete
-                notify_research_complete(workflow_id, topic, parsed.get("summary", ""))
+                from slack_service import notify_research_complete, submit_notification
+                submit_notification(
+                    notify_research_complete, workflow_id, topic, parsed.get("summary", ""),
+                    coalesce_key=("research", workflow_id)
+                )
             except Exception as slack_err:
                 print(f"[Workflow {workflow_id}] Slack notification skipped: {slack_err}")
 
@@ -506,7 +510,7 @@ def _run_research_thread(
         except Exception:
             pass
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 # ──────────────────────────────────────
@@ -613,11 +617,12 @@ def _run_refinement_thread(workflow_id: int, feedback: str, openclaw_session_id:
 
             # Notify via Slack
             try:
-                from slack_service import notify_research_complete
-                notify_research_complete(
-                    workflow_id, workflow.title, parsed.get("summary", ""),
+                from slack_service import notify_research_complete, submit_notification
+                submit_notification(
+                    notify_research_complete, workflow_id, workflow.title, parsed.get("summary", ""),
                     is_refinement=True,
-                    iteration=research_step.iteration_count
+                    iteration=research_step.iteration_count,
+                    coalesce_key=("research", workflow_id)
                 )
             except Exception as slack_err:
                 print(f"[Workflow {workflow_id}] Slack notification skipped: {slack_err}")
@@ -644,7 +649,7 @@ def _run_refinement_thread(workflow_id: int, feedback: str, openclaw_session_id:
         except Exception:
             pass
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 # ──────────────────────────────────────
@@ -807,7 +812,7 @@ def _run_agent_chat_reply_thread(workflow_id: int, latest_user_message: str):
         import traceback
         traceback.print_exc()
     finally:
-        db.close()
+        SessionLocal.remove()
 
 
 # ──────────────────────────────────────
@@ -925,12 +930,14 @@ def _poll_slidespeak_status(task_id: str, deadline_epoch: float) -> dict:
 
 
 def _download_to_file(download_url: str, file_path: str) -> int:
-    response = requests.get(download_url, stream=True, timeout=SLIDESPEAK_DOWNLOAD_TIMEOUT_SECONDS)
-    response.raise_for_status()
-    with open(file_path, "wb") as handle:
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:
-                handle.write(chunk)
+    # Close the streamed response so its connection goes back to the pool
+    with SESSION.get(download_url, stream=True, timeout=SLIDESPEAK_DOWNLOAD_TIMEOUT_SECONDS) as response:
+        response.raise_for_status()
+        # Copy the raw stream in 1 MiB blocks; decode_content undoes any
+        # gzip/deflate transfer encoding that iter_content used to handle.
+        response.raw.decode_content = True
+        with open(file_path, "wb", buffering=DOWNLOAD_CHUNK_BYTES) as handle:
+            shutil.copyfileobj(response.raw, handle, length=DOWNLOAD_CHUNK_BYTES)
     return os.path.getsize(file_path)
 
 
@@ -1469,8 +1476,8 @@ def _run_ppt_generation_thread(
             f"verbosity={generation_spec.get('verbosity', 'text-heavy')}, "
             f"source={generation_spec.get('source', 'fallback')}"
         )
-        create_event(
-            db, workflow_id=workflow_id, event_type="generation_reconciled",
+        enqueue_event(
+            workflow_id=workflow_id, event_type="generation_reconciled",
             actor_type="agent", step_id=gen_step.id,
             message=spec_summary
         )
@@ -1502,8 +1509,8 @@ def _run_ppt_generation_thread(
         if not source_validation.get("ok"):
             retried_for_sources = True
             retry_reason = source_validation.get("reason", "Sources slide URL validation failed.")
-            create_event(
-                db, workflow_id=workflow_id, event_type="generation_retry_requested",
+            enqueue_event(
+                workflow_id=workflow_id, event_type="generation_retry_requested",
                 actor_type="system", step_id=gen_step.id,
                 message=f"Auto-retrying PPT generation once: {retry_reason}"
             )
@@ -1534,8 +1541,8 @@ def _run_ppt_generation_thread(
                 except OSError:
                     pass
             if not source_validation.get("ok"):
-                create_event(
-                    db, workflow_id=workflow_id, event_type="generation_retry_failed",
+                enqueue_event(
+                    workflow_id=workflow_id, event_type="generation_retry_failed",
                     actor_type="system", step_id=gen_step.id,
                     message=(
                         "Retry still failed sources validation. "
@@ -1549,14 +1556,14 @@ def _run_ppt_generation_thread(
                         "Could not enforce final sources slide with explicit URLs after retry and post-processing: "
                         f"{source_validation.get('reason', 'unknown validation error')}"
                     )
-                create_event(
-                    db, workflow_id=workflow_id, event_type="generation_sources_enforced",
+                enqueue_event(
+                    workflow_id=workflow_id, event_type="generation_sources_enforced",
                     actor_type="system", step_id=gen_step.id,
                     message="A deterministic sources slide was appended successfully."
                 )
             else:
-                create_event(
-                    db, workflow_id=workflow_id, event_type="generation_retry_succeeded",
+                enqueue_event(
+                    workflow_id=workflow_id, event_type="generation_retry_succeeded",
                     actor_type="system", step_id=gen_step.id,
                     message="Auto-retry succeeded with explicit source URLs on the final slide."
                 )
@@ -1599,8 +1606,8 @@ def _run_ppt_generation_thread(
 
         # Notify via Slack
         try:
-            from slack_service import notify_ppt_complete
-            notify_ppt_complete(workflow_id, filename_hint or presentation_focus, ppt_result["file_name"])
+            from slack_service import notify_ppt_complete, submit_notification
+            submit_notification(notify_ppt_complete, workflow_id, filename_hint or presentation_focus, ppt_result["file_name"])
         except Exception:
             pass
 
@@ -1623,4 +1630,4 @@ def _run_ppt_generation_thread(
         except Exception:
             pass
     finally:
-        db.close()
+        SessionLocal.remove()
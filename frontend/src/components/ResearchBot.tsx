@@ -3,6 +3,11 @@ import axios from 'axios';
 import { toast } from 'react-toastify';
 import Card from './ui/Card';
 
+const POLL_INTERVAL_MS = 5000;
+const MAX_POLL_ATTEMPTS = 60; // 5 minutes with 5-second intervals
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
 const ResearchBot: React.FC = () => {
     const [topic, setTopic] = useState<string>('');
     const [loading, setLoading] = useState<boolean>(false);
@@ -28,8 +33,20 @@ const ResearchBot: React.FC = () => {
                 }
             );
 
-            setResult(response.data);
-            toast.success('Research completed successfully!');
+            // The backend runs research as a background job; poll until it finishes
+            const jobId = response.data.job_id;
+            for (let attempt = 0; attempt < MAX_POLL_ATTEMPTS; attempt++) {
+                await sleep(POLL_INTERVAL_MS);
+                const statusResponse = await axios.get(
+                    `${import.meta.env.VITE_API_URL}/research/${jobId}`
+                );
+                if (statusResponse.status === 200) {
+                    setResult(statusResponse.data);
+                    toast.success('Research completed successfully!');
+                    return;
+                }
+            }
+            toast.error('Research is taking longer than expected. Please try again later.');
         } catch (error: any) {
             console.error(error);
             const errorMsg = error.response?.data?.error || 'Failed to start research. Please try again.';